@@ -0,0 +1,55 @@
+# app/agents/middleware/tool_failure.py
+from langchain.agents.middleware import AgentMiddleware, hook_config
+from langchain_core.messages import AIMessage, ToolMessage
+
+from app.agents.tools.planner_tools import SEARCH_ERROR_PREFIX
+
+# DuckDuckGoSearchRun's answer when a query has no hits
+_NO_RESULTS = "No good DuckDuckGo Search Result was found"
+
+
+def _is_failed_result(text: str) -> bool:
+    text = text.strip()
+    return not text or text.startswith((SEARCH_ERROR_PREFIX, _NO_RESULTS))
+
+
+def is_failed_tool_message(message: ToolMessage) -> bool:
+    """True when a tool result carries nothing the model could use."""
+    if message.status == "error":
+        return True
+    content = message.content if isinstance(message.content, str) else ""
+    if message.name == "web_search_batch":
+        # One "## <query>\n<result>" section per query; failed only if all are
+        sections = content.split("\n\n## ")
+        return all(_is_failed_result(section.partition("\n")[2]) for section in sections)
+    return _is_failed_result(content)
+
+
+class ToolFailureShortCircuitMiddleware(AgentMiddleware):
+    """
+    End the agent loop without another model call when every result of the
+    latest tool round failed (search errors, rate limits, empty results).
+
+    The agent then finishes without a structured_response, so callers must
+    handle that case.
+    """
+
+    def __init__(self, message: str):
+        super().__init__()
+        self.message = message
+
+    @hook_config(can_jump_to=["end"])
+    def before_model(self, state, runtime):
+        latest_round = []
+        for message in reversed(state["messages"]):
+            if not isinstance(message, ToolMessage):
+                break
+            latest_round.append(message)
+
+        if latest_round and all(is_failed_tool_message(m) for m in latest_round):
+            return {"jump_to": "end", "messages": [AIMessage(content=self.message)]}
+        return None
+
+    @hook_config(can_jump_to=["end"])
+    async def abefore_model(self, state, runtime):
+        return self.before_model(state, runtime)
@@ -0,0 +1,53 @@
+# app/agents/middleware/trim_history.py
+from typing import List
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import AnyMessage, HumanMessage, ToolMessage
+
+
+def trim_history(messages: List[AnyMessage], keep_last: int) -> List[AnyMessage]:
+    """
+    Keep everything up to the first user message plus the last `keep_last` messages.
+
+    The cut never lands on a ToolMessage, so every kept tool result still has
+    the AI message that requested it.
+    """
+    if keep_last < 1:
+        raise ValueError(f"keep_last must be at least 1, got {keep_last}")
+    first_human = next(
+        (i for i, m in enumerate(messages) if isinstance(m, HumanMessage)), 0
+    )
+    start = len(messages) - keep_last
+    while start > 0 and isinstance(messages[start], ToolMessage):
+        start -= 1
+
+    if start <= first_human + 1:
+        return messages
+    return [*messages[: first_human + 1], *messages[start:]]
+
+
+class TrimHistoryMiddleware(AgentMiddleware):
+    """
+    Send only the task prompt and the most recent tool rounds to the model.
+
+    The agent's state keeps the full history; only the model request is trimmed,
+    so input tokens stop growing with every tool round.
+    """
+
+    def __init__(self, keep_last: int = 6):
+        super().__init__()
+        if keep_last < 1:
+            raise ValueError(f"keep_last must be at least 1, got {keep_last}")
+        self.keep_last = keep_last
+
+    def _trim(self, request):
+        trimmed = trim_history(request.messages, self.keep_last)
+        if trimmed is request.messages:
+            return request
+        return request.override(messages=trimmed)
+
+    def wrap_model_call(self, request, handler):
+        return handler(self._trim(request))
+
+    async def awrap_model_call(self, request, handler):
+        return await handler(self._trim(request))
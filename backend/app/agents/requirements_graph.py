@@ -1,15 +1,15 @@
-import json
+import asyncio
+import sys
+import threading
 from typing import Optional
 
-from langchain.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage
 from langgraph.graph import StateGraph, MessagesState, START, END
 from langgraph.types import interrupt, Command
-from langgraph.checkpoint.memory import InMemorySaver
 
 from app.agents.travel_system_agents import requirements_agent
-
-
-checkpointer = InMemorySaver()
+from app.core.checkpointer import checkpointer
+from app.utils.json_fast import dumps_pretty
 
 
 class RequirementsGraphState(MessagesState):
@@ -18,8 +18,8 @@ class RequirementsGraphState(MessagesState):
     requirements: Optional[dict]
 
 
-def requirements_agent_node(state: RequirementsGraphState) -> RequirementsGraphState:
-    response = requirements_agent.invoke({"messages": state["messages"]})
+async def requirements_agent_node(state: RequirementsGraphState) -> RequirementsGraphState:
+    response = await requirements_agent.ainvoke({"messages": state["messages"]})
 
     response = response["structured_response"]
     requirements_response = response.requirements
@@ -72,7 +72,32 @@ graph.add_edge("ask_user_for_info", "requirements_agent")
 compiled_graph = graph.compile(checkpointer=checkpointer)
 
 
-if __name__ == "__main__":
+# Queued by the stdin reader once input is exhausted
+_END_OF_INPUT = None
+
+
+def _offer_user_input(queue: asyncio.Queue, user_input: str) -> None:
+    try:
+        queue.put_nowait(user_input)
+    except asyncio.QueueFull:
+        print(f"Input queue full, dropping: {user_input!r}")
+
+
+def _read_stdin(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+    # Runs on a daemon thread so a pending read never blocks interpreter exit
+    for line in sys.stdin:
+        loop.call_soon_threadsafe(_offer_user_input, queue, line.rstrip("\n"))
+    # Wait for room rather than dropping it, so the consumer always sees EOF
+    asyncio.run_coroutine_threadsafe(queue.put(_END_OF_INPUT), loop).result()
+
+
+async def main():
+    # Bounded so bursts of input can't queue up unbounded graph invocations
+    user_inputs: asyncio.Queue = asyncio.Queue(maxsize=4)
+    threading.Thread(
+        target=_read_stdin, args=(asyncio.get_running_loop(), user_inputs), daemon=True
+    ).start()
+
     initial_state = RequirementsGraphState(
         messages=[
             HumanMessage(
@@ -83,18 +108,30 @@ if __name__ == "__main__":
 
     config = {"configurable": {"thread_id": "thread-1"}}
 
-    result = compiled_graph.invoke(initial_state, config)
+    result = await compiled_graph.ainvoke(initial_state, config)
 
-    while True:
-        if "__interrupt__" in result:
-            print(result["__interrupt__"])
+    while "__interrupt__" in result:
+        print(result["__interrupt__"])
 
-            user_input = input("")
+        user_input = await user_inputs.get()
+        if user_input is _END_OF_INPUT:
+            print("End of input, stopping")
+            return
+        # Coalesce anything typed while the previous turn was running
+        while not user_inputs.empty():
+            next_input = user_inputs.get_nowait()
+            if next_input is _END_OF_INPUT:
+                # Answer with what was read; the next get() sees EOF again
+                user_inputs.put_nowait(_END_OF_INPUT)
+                break
+            user_input += "\n" + next_input
 
-            current_state = Command(resume=user_input)
+        current_state = Command(resume=user_input)
 
-            result = compiled_graph.invoke(current_state, config)
-        else:
-            break
+        result = await compiled_graph.ainvoke(current_state, config)
 
-    print(result["requirements"])
+    print(dumps_pretty(result["requirements"]))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -32,7 +32,17 @@ class Bookings(BaseModel):
     )
 
 
-class BookerAgentResponseModel(BaseModel):
-    """Response model for the booker agent."""
+class FlightBookerResponseModel(BaseModel):
+    """Response model for the flight booker agent."""
 
-    bookings: Bookings = Field(..., description="All booking confirmations")
+    flight: Optional[FlightBookingResult] = Field(
+        None, description="Flight booking confirmation, or null if the booking failed"
+    )
+
+
+class HotelBookerResponseModel(BaseModel):
+    """Response model for the hotel booker agent."""
+
+    hotel: Optional[HotelBookingResult] = Field(
+        None, description="Hotel booking confirmation, or null if no hotel was booked"
+    )
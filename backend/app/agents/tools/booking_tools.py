@@ -1,11 +1,16 @@
 # app/agents/tools/booking_tools.py
+import logging
 from typing import Optional
 
-import requests
+import httpx
+import orjson
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
 from app.config import settings
+from app.core.http_client import convex_client
+
+logger = logging.getLogger(__name__)
 
 
 class FlightBookingInput(BaseModel):
@@ -40,18 +45,14 @@ class HotelBookingInput(BaseModel):
 
 
 @tool("search_hotels", args_schema=HotelSearchInput)
-def search_hotels(
+async def search_hotels(
     city: str, check_in: Optional[str] = None, check_out: Optional[str] = None
 ) -> dict:
     """
     Searches for hotels in a city with optional check-in and check-out dates.
     Returns a list of available hotels with their details.
     """
-    print(f"--- TOOL CALLED: Searching hotels in {city} ---")
-    if check_in:
-        print(f"  Check-in: {check_in}")
-    if check_out:
-        print(f"  Check-out: {check_out}")
+    logger.debug("tool=search_hotels city=%s check_in=%s check_out=%s", city, check_in, check_out)
 
     api_url = f"{settings.CONVEX_BASE_URL}/hotels/search"
     params = {"city": city}
@@ -61,21 +62,21 @@ def search_hotels(
         params["checkOut"] = check_out
 
     try:
-        response = requests.get(api_url, params=params, timeout=10)
+        response = await convex_client.get(api_url, params=params)
         response.raise_for_status()
 
-        hotels = response.json().get("hotels", [])
+        hotels = orjson.loads(response.content).get("hotels", [])
 
         if not hotels:
             return {"available": False, "hotels": []}
 
         return {"available": True, "hotels": hotels}
 
-    except requests.exceptions.RequestException as e:
-        print(f"API call failed: {e}")
+    except httpx.HTTPError as e:
+        logger.warning("API call failed: %s", e)
         return {"available": False, "hotels": [], "error": str(e)}
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+    except Exception:
+        logger.exception("An unexpected error occurred")
         return {
             "available": False,
             "hotels": [],
@@ -84,14 +85,12 @@ def search_hotels(
 
 
 @tool("book_flight", args_schema=FlightBookingInput)
-def book_flight(flight_id: str, passenger_name: str, passenger_email: str) -> dict:
+async def book_flight(flight_id: str, passenger_name: str, passenger_email: str) -> dict:
     """
     Books a flight reservation using the confirmed flight ID.
     Returns booking confirmation with booking ID, reference, seat number, and status.
     """
-    print(
-        f"--- TOOL CALLED: Booking flight {flight_id} for {passenger_name} ({passenger_email}) ---"
-    )
+    logger.debug("tool=book_flight flight_id=%s passenger=%s", flight_id, passenger_name)
 
     api_url = f"{settings.CONVEX_BASE_URL}/flights/book"
     payload = {
@@ -99,16 +98,15 @@ def book_flight(flight_id: str, passenger_name: str, passenger_email: str) -> di
         "passengerName": passenger_name,
         "passengerEmail": passenger_email,
     }
-    headers = {"Content-Type": "application/json"}
 
     try:
-        response = requests.post(api_url, json=payload, headers=headers, timeout=10)
+        response = await convex_client.post(api_url, json=payload)
         response.raise_for_status()
 
-        result = response.json()
+        result = orjson.loads(response.content)
 
         if result.get("success"):
-            booking = result.get("booking", {})
+            booking = result.get("booking") or {}
             return {
                 "success": True,
                 "booking_id": booking.get("bookingId"),
@@ -119,16 +117,16 @@ def book_flight(flight_id: str, passenger_name: str, passenger_email: str) -> di
 
         return {"success": False, "error": "Booking failed"}
 
-    except requests.exceptions.RequestException as e:
-        print(f"API call failed: {e}")
+    except httpx.HTTPError as e:
+        logger.warning("API call failed: %s", e)
         return {"success": False, "error": str(e)}
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+    except Exception:
+        logger.exception("An unexpected error occurred")
         return {"success": False, "error": "An internal error occurred."}
 
 
 @tool("book_hotel", args_schema=HotelBookingInput)
-def book_hotel(
+async def book_hotel(
     hotel_id: str,
     guest_name: str,
     guest_email: str,
@@ -140,11 +138,9 @@ def book_hotel(
     Books a hotel reservation using the hotel ID, dates, and room type.
     Returns booking confirmation with booking ID, reference, number of nights, total price, and status.
     """
-    print(
-        f"--- TOOL CALLED: Booking hotel {hotel_id} for {guest_name} ({guest_email}) ---"
-    )
-    print(
-        f"  Check-in: {check_in_date}, Check-out: {check_out_date}, Room: {room_type}"
+    logger.debug(
+        "tool=book_hotel hotel_id=%s guest=%s check_in=%s check_out=%s room=%s",
+        hotel_id, guest_name, check_in_date, check_out_date, room_type,
     )
 
     api_url = f"{settings.CONVEX_BASE_URL}/hotels/book"
@@ -156,16 +152,15 @@ def book_hotel(
         "checkOutDate": check_out_date,
         "roomType": room_type,
     }
-    headers = {"Content-Type": "application/json"}
 
     try:
-        response = requests.post(api_url, json=payload, headers=headers, timeout=10)
+        response = await convex_client.post(api_url, json=payload)
         response.raise_for_status()
 
-        result = response.json()
+        result = orjson.loads(response.content)
 
         if result.get("success"):
-            booking = result.get("booking", {})
+            booking = result.get("booking") or {}
             return {
                 "success": True,
                 "booking_id": booking.get("bookingId"),
@@ -177,9 +172,9 @@ def book_hotel(
 
         return {"success": False, "error": "Booking failed"}
 
-    except requests.exceptions.RequestException as e:
-        print(f"API call failed: {e}")
+    except httpx.HTTPError as e:
+        logger.warning("API call failed: %s", e)
         return {"success": False, "error": str(e)}
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+    except Exception:
+        logger.exception("An unexpected error occurred")
         return {"success": False, "error": "An internal error occurred."}
@@ -1,10 +1,16 @@
 # app/tools/flight_tools.py
-import requests
+import logging
 
+import httpx
+import orjson
+from cachetools import TTLCache
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
 from app.config import settings
+from app.core.http_client import convex_client
+
+logger = logging.getLogger(__name__)
 
 
 class FlightSearchInput(BaseModel):
@@ -18,53 +24,50 @@ class FlightSearchInput(BaseModel):
     )
 
 
+# Availability per route barely changes within a minute; only successful searches are cached
+_search_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+
+
 @tool("search_flight_availability", args_schema=FlightSearchInput)
-def search_flight_availability(origin: str, destination: str) -> dict:
+async def search_flight_availability(origin: str, destination: str) -> dict:
     """
     Checks if flights are available on a given date between two airports.
     Returns a small list of candidate options sorted by price.
     Only call this after you have the origin, destination, and date.
     """
-    # TOOL ENTRY LOG
-    print(f"\n[FLIGHT_SEARCH_TOOL] ===== TOOL START =====")
-    print(f"[FLIGHT_SEARCH_TOOL] Input parameters:")
-    print(f"[FLIGHT_SEARCH_TOOL]   origin: {origin}")
-    print(f"[FLIGHT_SEARCH_TOOL]   destination: {destination}")
+    logger.debug("tool=search_flight_availability origin=%s destination=%s", origin, destination)
+
+    cache_key = (origin.strip().upper(), destination.strip().upper())
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("tool=search_flight_availability cache hit")
+        return cached
 
     api_url = f"{settings.CONVEX_BASE_URL}/flights/search"
     params = {"origin": origin, "destination": destination}
 
     try:
-        response = requests.get(api_url, params=params, timeout=10)
+        response = await convex_client.get(api_url, params=params)
         response.raise_for_status()  # Raises an exception for 4XX/5XX errors
 
-        flights = response.json().get("flights", [])
+        flights = orjson.loads(response.content).get("flights") or []
+
+        logger.debug("tool=search_flight_availability options=%d", len(flights))
 
-        # TOOL EXIT LOG - Success case
-        result = None
         if not flights:
             result = {"available": False, "options": []}
-            print(f"[FLIGHT_SEARCH_TOOL] No flights available")
         else:
             result = {"available": True, "options": flights}
-            print(f"[FLIGHT_SEARCH_TOOL] Flights found: {len(flights)} option(s)")
-            for idx, flight in enumerate(flights[:3]):  # Log first 3 flights
-                print(f"[FLIGHT_SEARCH_TOOL]   Option {idx+1}: {flight.get('id', 'N/A')} - ${flight.get('price', 'N/A')}")
-
-        print(f"[FLIGHT_SEARCH_TOOL] ===== TOOL COMPLETE =====\n")
+        _search_cache[cache_key] = result
         return result
 
-    except requests.exceptions.RequestException as e:
-        print(f"[FLIGHT_SEARCH_TOOL] API call failed: {e}")
-        result = {"available": False, "options": [], "error": str(e)}
-        print(f"[FLIGHT_SEARCH_TOOL] ===== TOOL COMPLETE (ERROR) =====\n")
-        return result
-    except Exception as e:
-        print(f"[FLIGHT_SEARCH_TOOL] An unexpected error occurred: {e}")
-        result = {
+    except httpx.HTTPError as e:
+        logger.warning("tool=search_flight_availability API call failed: %s", e)
+        return {"available": False, "options": [], "error": str(e)}
+    except Exception:
+        logger.exception("tool=search_flight_availability unexpected error")
+        return {
             "available": False,
             "options": [],
             "error": "An internal error occurred.",
         }
-        print(f"[FLIGHT_SEARCH_TOOL] ===== TOOL COMPLETE (ERROR) =====\n")
-        return result
@@ -1,7 +1,17 @@
 # app/agents/tools/planner_tools.py
+import asyncio
+import functools
+import logging
+from typing import List
+
 from langchain_community.tools import DuckDuckGoSearchRun
 from langchain_core.tools import tool
 
+logger = logging.getLogger(__name__)
+
+# Prefix of every failed search result; the planner's tool-failure check keys on it
+SEARCH_ERROR_PREFIX = "Search error:"
+
 
 # Base DuckDuckGo search tool
 _base_web_search = DuckDuckGoSearchRun(
@@ -10,38 +20,56 @@ _base_web_search = DuckDuckGoSearchRun(
 )
 
 
-# Wrapper with logging for the web_search tool
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+# Cached per normalized query; failed searches raise and are not cached
+@functools.lru_cache(maxsize=1024)
+def _search(normalized_query: str) -> str:
+    return _base_web_search.run(normalized_query)
+
+
+async def _search_async(query: str) -> str:
+    return await asyncio.to_thread(_search, _normalize_query(query))
+
+
 @tool("web_search")
-def web_search(query: str) -> str:
+async def web_search(query: str) -> str:
     """
     Search the web for travel information, attractions, points of interest (POIs), and activities in a destination city.
     Use this to find popular sights, cultural sites, restaurants, shopping areas, and other tourist attractions.
     """
-    # TOOL ENTRY LOG
-    print(f"\n[WEB_SEARCH_TOOL] ===== TOOL START =====")
-    print(f"[WEB_SEARCH_TOOL] Input parameters:")
-    print(f"[WEB_SEARCH_TOOL]   query: {query}")
+    logger.debug("tool=web_search query=%r", query)
 
     try:
-        # Call the base DuckDuckGo search
-        result = _base_web_search.run(query)
+        # Call the (cached) base DuckDuckGo search
+        result = await _search_async(query)
+        logger.debug("tool=web_search result_chars=%d", len(result))
+        return result
 
-        # TOOL EXIT LOG - Success case
-        result_lines = result.split('\n') if result else []
-        result_preview = '\n'.join(result_lines[:3]) if result_lines else "No results"
+    except Exception as e:
+        logger.warning("tool=web_search query=%r failed: %s", query, e)
+        return f"{SEARCH_ERROR_PREFIX} {str(e)}"
 
-        print(f"[WEB_SEARCH_TOOL] Search completed successfully")
-        print(f"[WEB_SEARCH_TOOL] Result preview (first 3 lines):")
-        for line in result_lines[:3]:
-            if line.strip():
-                print(f"[WEB_SEARCH_TOOL]   {line[:100]}")
-        print(f"[WEB_SEARCH_TOOL] Total result length: {len(result)} characters")
-        print(f"[WEB_SEARCH_TOOL] ===== TOOL COMPLETE =====\n")
 
-        return result
+@tool("web_search_batch")
+async def web_search_batch(queries: List[str]) -> str:
+    """
+    Run several web searches at once and return all results in one response.
+    Prefer this over repeated web_search calls: pass every attraction/activity query
+    for the trip (e.g. one per day or interest) in a single call.
+    """
+    logger.debug("tool=web_search_batch queries=%r", queries)
 
-    except Exception as e:
-        print(f"[WEB_SEARCH_TOOL] Error during search: {e}")
-        error_result = f"Search error: {str(e)}"
-        print(f"[WEB_SEARCH_TOOL] ===== TOOL COMPLETE (ERROR) =====\n")
-        return error_result
+    results = await asyncio.gather(
+        *[_search_async(q) for q in queries], return_exceptions=True
+    )
+
+    sections = []
+    for query, result in zip(queries, results):
+        if isinstance(result, Exception):
+            logger.warning("tool=web_search_batch query=%r failed: %s", query, result)
+            result = f"{SEARCH_ERROR_PREFIX} {str(result)}"
+        sections.append(f"## {query}\n{result}")
+    return "\n\n".join(sections)
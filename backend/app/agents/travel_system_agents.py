@@ -1,51 +1,82 @@
 # app/agents/travel_system.py
-from langgraph.checkpoint.memory import MemorySaver
+import asyncio
+
 from langchain.agents import create_agent
 from langchain.agents.structured_output import ToolStrategy
 
+from app.agents.middleware.tool_failure import ToolFailureShortCircuitMiddleware
+from app.agents.middleware.trim_history import TrimHistoryMiddleware
 from app.agents.tools.flight_tools import search_flight_availability
-from app.agents.tools.planner_tools import web_search
-from app.agents.tools.booking_tools import book_flight, book_hotel, search_hotels
+from app.agents.tools.planner_tools import web_search, web_search_batch
+from app.agents.tools.booking_tools import book_flight, book_hotel
 from app.agents.response_models.requirements_agent import RequirementsAgentResponseModel
 from app.agents.response_models.planner_agent import PlannerAgentResponseModel
-from app.agents.response_models.booker_agent import BookerAgentResponseModel
+from app.agents.response_models.booker_agent import (
+    FlightBookerResponseModel,
+    HotelBookerResponseModel,
+)
 from app.agents.prompts.travel_system import (
     REQUIREMENTS_AGENT_SYSTEM_PROMPT,
     PLANNER_AGENT_SYSTEM_PROMPT,
-    BOOKER_AGENT_SYSTEM_PROMPT,
+    FLIGHT_BOOKER_AGENT_SYSTEM_PROMPT,
+    HOTEL_BOOKER_AGENT_SYSTEM_PROMPT,
 )
 from app.core.llm import model
 
 
+# ToolStrategy exposes the response model as one more tool next to the real ones,
+# so each turn is a single model call: either real tool calls or the structured
+# response - never a tools call followed by a separate structured-output call.
 requirements_agent = create_agent(
     model=model,
     name="requirements",
     tools=[search_flight_availability],
     response_format=ToolStrategy(RequirementsAgentResponseModel),
     system_prompt=REQUIREMENTS_AGENT_SYSTEM_PROMPT,
-    # checkpointer=MemorySaver(),  # Manages state in memory for the session
 )
 
 planner_agent = create_agent(
     model=model,
     name="planner",
-    tools=[web_search],
+    tools=[web_search_batch, web_search],
     response_format=ToolStrategy(PlannerAgentResponseModel),
     system_prompt=PLANNER_AGENT_SYSTEM_PROMPT,
+    middleware=[
+        ToolFailureShortCircuitMiddleware(
+            "I couldn't look up activities for this trip right now."
+        ),
+        TrimHistoryMiddleware(keep_last=6),
+    ],
 )
 
-booker_agent = create_agent(
+# The flight and hotel bookings run in parallel branches, so each agent only
+# gets its own booking tool - neither can make the other's (real) booking.
+flight_booker_agent = create_agent(
     model=model,
-    name="booker",
-    tools=[book_flight, book_hotel, search_hotels],
-    response_format=ToolStrategy(BookerAgentResponseModel),
-    system_prompt=BOOKER_AGENT_SYSTEM_PROMPT,
+    name="flight_booker",
+    tools=[book_flight],
+    response_format=ToolStrategy(FlightBookerResponseModel),
+    system_prompt=FLIGHT_BOOKER_AGENT_SYSTEM_PROMPT,
+    middleware=[TrimHistoryMiddleware(keep_last=6)],
 )
 
+hotel_booker_agent = create_agent(
+    model=model,
+    name="hotel_booker",
+    tools=[book_hotel],
+    response_format=ToolStrategy(HotelBookerResponseModel),
+    system_prompt=HOTEL_BOOKER_AGENT_SYSTEM_PROMPT,
+    middleware=[TrimHistoryMiddleware(keep_last=6)],
+)
 
-if __name__ == "__main__":
-    for chunk in requirements_agent.stream(
+
+async def main():
+    async for chunk in requirements_agent.astream(
         input={"messages": ["I want to go to Tokyo from Tokyo on October 26th, 2025."]},
         stream_mode="updates",
     ):
         print(chunk)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,29 +1,72 @@
-import json
+import functools
+import logging
 from typing import Optional
 
-from langchain.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage
 from langgraph.graph import StateGraph, MessagesState, START, END
-from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.types import Command, interrupt
 from langchain_core.runnables import RunnableConfig
 
 from app.agents.requirements_graph import compiled_graph as requirements_graph
-from app.agents.travel_system_agents import planner_agent, booker_agent
+from app.agents.travel_system_agents import (
+    planner_agent,
+    flight_booker_agent,
+    hotel_booker_agent,
+)
+from app.agents.response_models.planner_agent import (
+    Activity,
+    DayItinerary,
+    Itinerary,
+    PlannerAgentResponseModel,
+)
+from app.agents.prompts.travel_system import (
+    PLANNER_TASK_PROMPT_TEMPLATE,
+    BOOK_FLIGHT_TASK_PROMPT_TEMPLATE,
+    BOOK_HOTEL_TASK_PROMPT_TEMPLATE,
+)
+from app.agents.tools.booking_tools import search_hotels
 from app.agents.requirements_graph import RequirementsGraphState
+from app.core.checkpointer import checkpointer
+from app.utils.json_fast import dumps
 
-
-checkpointer = InMemorySaver()
+logger = logging.getLogger(__name__)
 
 
 class TravelSystemState(MessagesState):
     """State for the full travel planning pipeline."""
 
     requirements: Optional[dict]  # CompleteRequirements dict from requirements graph
+    requirements_question: Optional[str]  # Pending question from the requirements subgraph
+    requirements_json: Optional[str]  # requirements serialized once for the planner/booker prompts
     itinerary: Optional[dict]  # Itinerary dict from planner agent
-    bookings: Optional[dict]  # Bookings dict from booker agent
+    itinerary_json: Optional[str]  # itinerary serialized once for the booker prompt
+    hotel_options: Optional[dict]  # search_hotels result, fetched alongside the planner
+    flight_booking: Optional[dict]  # Flight booking from book_flight node
+    hotel_booking: Optional[dict]  # Hotel booking from book_hotel node
+    bookings: Optional[dict]  # Combined flight + hotel bookings from merge_bookings
+
+
+def _extract_interrupt_message(interrupts) -> str:
+    """Get the question text out of a subgraph's pending interrupt(s)."""
+    if isinstance(interrupts, (list, tuple)):
+        if not interrupts:
+            return ""
+        interrupts = interrupts[0]
+    return str(getattr(interrupts, "value", interrupts))
+
+
+@functools.lru_cache(maxsize=1024)
+def _subgraph_config(parent_thread_id: str) -> RunnableConfig:
+    """
+    Config for the requirements subgraph thread of a parent thread.
+
+    Cached so interrupt round-trips on the same conversation reuse one config;
+    LangGraph copies configs before use, so sharing it is safe.
+    """
+    return {"configurable": {"thread_id": f"{parent_thread_id}-requirements"}}
 
 
-def requirements_subgraph_node(
+async def requirements_subgraph_node(
     state: TravelSystemState, config: RunnableConfig
 ) -> TravelSystemState:
     """
@@ -47,84 +90,60 @@ def requirements_subgraph_node(
 
     # Extract parent's thread_id from config and derive subgraph thread_id
     # RunnableConfig is dict-like with "configurable" key containing thread_id
-    configurable = config.get("configurable", {}) if config else {}
+    configurable = (config.get("configurable") if config else None) or {}
     parent_thread_id = configurable.get("thread_id", "main-thread")
-    subgraph_thread_id = f"{parent_thread_id}-requirements"
-    subgraph_config = {"configurable": {"thread_id": subgraph_thread_id}}
-
-    # Check if we have a pending interrupt by trying to get resume value
-    # If we're resuming, the previous interrupt() call will return the resume value
-    # We need to structure this so we can capture it
-    # First, try normal invocation
-    subgraph_state = RequirementsGraphState(
-        messages=state["messages"],
-        requirements_complete=False,
-        interruption_message="",
-        requirements=state.get("requirements"),
-    )
-    
-    subgraph_result = requirements_graph.invoke(
-        subgraph_state,
-        subgraph_config,
-    )
-
-    # Check if subgraph has an interrupt - propagate it to top level
-    if "__interrupt__" in subgraph_result:
-        # Extract interrupt message
-        interrupt_value = subgraph_result["__interrupt__"]
-        if isinstance(interrupt_value, (list, tuple)) and len(interrupt_value) > 0:
-            # Extract the interrupt value - could be a dict or string
-            interrupt_obj = interrupt_value[0]
-            if hasattr(interrupt_obj, "value"):
-                interrupt_message = str(interrupt_obj.value)
-            else:
-                interrupt_message = str(interrupt_obj)
-        else:
-            interrupt_message = str(interrupt_value)
-
+    subgraph_config = _subgraph_config(parent_thread_id)
+
+    # A question from the previous pass is pending: ask the user and resume the
+    # subgraph with the answer instead of restarting it (which would re-run the
+    # requirements agent). A new chat message resets requirements_question, so
+    # it restarts the subgraph with the full conversation as before.
+    pending_question = state.get("requirements_question")
+    if pending_question:
         # Propagate interrupt to top-level graph using interrupt()
         # This will pause the top-level graph and return the interrupt to the API
         # When resumed, interrupt() will return the resume value
-        user_response = interrupt(interrupt_message)
-        
-        # If we get here, we're resuming - resume the subgraph with user response
-        subgraph_result = requirements_graph.invoke(
-            Command(resume=user_response),
-            subgraph_config,
+        user_response = interrupt(pending_question)
+        subgraph_input = Command(resume=user_response)
+    else:
+        subgraph_input = RequirementsGraphState(
+            messages=state["messages"],
+            requirements_complete=False,
+            interruption_message="",
+            requirements=state.get("requirements"),
         )
-        
-        # Check again for interrupts (subgraph might need more info)
-        if "__interrupt__" in subgraph_result:
-            interrupt_value = subgraph_result["__interrupt__"]
-            if isinstance(interrupt_value, (list, tuple)) and len(interrupt_value) > 0:
-                interrupt_obj = interrupt_value[0]
-                if hasattr(interrupt_obj, "value"):
-                    interrupt_message = str(interrupt_obj.value)
-                else:
-                    interrupt_message = str(interrupt_obj)
-            else:
-                interrupt_message = str(interrupt_value)
-            
-            # Propagate the new interrupt
-            interrupt(interrupt_message)
+
+    subgraph_result = await requirements_graph.ainvoke(subgraph_input, subgraph_config)
+
+    if "__interrupt__" in subgraph_result:
+        # Subgraph needs (more) info. Loop back through this node so each question
+        # gets its own interrupt() - a second interrupt() in the same task would be
+        # answered with the first resume value on replay.
+        logger.debug("node=requirements_subgraph interrupted=true")
+        return {
+            "requirements_question": _extract_interrupt_message(subgraph_result["__interrupt__"]),
+        }
 
     # No interrupt, execution completed - extract requirements
     requirements = subgraph_result.get("requirements")
 
     # Generate conversational summary from requirements
     if requirements:
-        origin = requirements.get('trip', {}).get('origin', {}).get('city', 'your origin')
-        destination = requirements.get('trip', {}).get('destination', {}).get('city', 'your destination')
+        trip = requirements.get("trip") or {}
+        origin = (trip.get("origin") or {}).get("city") or "your origin"
+        destination = (trip.get("destination") or {}).get("city") or "your destination"
         summary = f"Perfect! I've gathered your travel requirements for a trip from {origin} to {destination}. Let me create an itinerary for you..."
     else:
         summary = "I've gathered your travel requirements. Let me create an itinerary for you..."
 
     # NODE EXIT LOG
+    # Only return the fields this node changed - the others were already reset
+    # by the new turn's input state, and echoing them re-checkpoints them
     result = {
         "messages": [AIMessage(content=summary, name="requirements")],
         "requirements": requirements,
-        "itinerary": None,
-        "bookings": None,
+        "requirements_question": None,
+        "requirements_json": dumps(requirements) if requirements else None,
     }
     print(f"[REQUIREMENTS_SUBGRAPH] Returning state update:")
     for key, value in result.items():
@@ -142,7 +161,43 @@ def requirements_subgraph_node(
     return result
 
 
-def planner_agent_node(state: TravelSystemState) -> TravelSystemState:
+def _is_single_day_fixed(requirements: Optional[dict]) -> bool:
+    """True for a same-day round trip with fixed dates and a known destination."""
+    if not requirements:
+        return False
+    trip = requirements.get("trip") or {}
+    preferences = requirements.get("preferences") or {}
+    depart_date = trip.get("depart_date")
+    return bool(
+        depart_date
+        and trip.get("return_date") == depart_date
+        and not preferences.get("date_flex_days")
+        and (trip.get("destination") or {}).get("city")
+    )
+
+
+def _build_deterministic_itinerary(requirements: dict) -> Itinerary:
+    """
+    Build a one-day itinerary straight from the requirements.
+
+    A day trip has a single date and city, so the plan is one activity per
+    stated interest (up to three) rather than an LLM call.
+    """
+    trip = requirements["trip"]
+    city = trip["destination"]["city"]
+    interests = (requirements.get("preferences") or {}).get("interests") or []
+
+    activities = [
+        Activity(name=f"{interest.title()} in {city}", type=interest)
+        for interest in interests[:3]
+    ] or [Activity(name=f"Explore {city}", type="sightseeing")]
+
+    return Itinerary(
+        days=[DayItinerary(date=trip["depart_date"], city=city, activities=activities)]
+    )
+
+
+async def planner_agent_node(state: TravelSystemState) -> TravelSystemState:
     """
     Invoke planner agent to create itinerary based on requirements.
     """
@@ -160,22 +215,39 @@ def planner_agent_node(state: TravelSystemState) -> TravelSystemState:
 
     requirements = state.get("requirements")
 
-    # Format requirements into context message for planner
-    requirements_str = json.dumps(requirements, indent=2)
-    planner_prompt = f"""Based on the following travel requirements, create a day-by-day itinerary:
-
-{requirements_str}"""
-
-    # Invoke planner agent
-    response = planner_agent.invoke(
-        {"messages": [HumanMessage(content=planner_prompt)]}
-    )
+    if _is_single_day_fixed(requirements):
+        # Day trip: nothing for the planner to sequence, skip the LLM call
+        logger.info("planner_shortcut=hit reason=single_day_fixed")
+        structured_response = PlannerAgentResponseModel(
+            itinerary=_build_deterministic_itinerary(requirements)
+        )
+    else:
+        logger.info("planner_shortcut=miss")
+        # Format requirements into context message for planner (compact JSON - indentation only costs tokens)
+        requirements_str = state.get("requirements_json") or dumps(requirements)
+        planner_prompt = PLANNER_TASK_PROMPT_TEMPLATE.format(requirements=requirements_str)
+
+        # Invoke planner agent
+        response = await planner_agent.ainvoke(
+            {"messages": [HumanMessage(content=planner_prompt)]}
+        )
+        structured_response = response.get("structured_response")
 
-    itinerary = response["structured_response"].itinerary.model_dump()
+    if structured_response is None:
+        # Planner stopped early because every web search failed
+        itinerary = {"days": []}
+        itinerary_json = dumps(itinerary)
+    else:
+        # Serialize straight from the model (pydantic-core) rather than
+        # re-encoding the dumped dict
+        itinerary = structured_response.itinerary.model_dump()
+        itinerary_json = structured_response.itinerary.model_dump_json()
 
     # Generate conversational summary
     num_days = len(itinerary.get('days', []))
-    if num_days > 0:
+    if structured_response is None:
+        summary = "I couldn't look up activities for your destination right now, so I'll skip the itinerary. Now let me book your flights and accommodations..."
+    elif num_days > 0:
         summary = f"Great! I've created a {num_days}-day itinerary for you. Now let me book your flights and accommodations..."
     else:
         summary = "I've created your itinerary. Now let me book your flights and accommodations..."
@@ -183,9 +255,8 @@ def planner_agent_node(state: TravelSystemState) -> TravelSystemState:
     # NODE EXIT LOG
     result = {
         "messages": [AIMessage(content=summary, name="planner")],
-        "requirements": requirements,
         "itinerary": itinerary,
-        "bookings": None,
+        "itinerary_json": itinerary_json,
     }
     print(f"[PLANNER_AGENT] Returning state update:")
     for key, value in result.items():
@@ -202,84 +273,113 @@ def planner_agent_node(state: TravelSystemState) -> TravelSystemState:
     return result
 
 
-def booker_agent_node(state: TravelSystemState) -> TravelSystemState:
+async def hotel_search_node(state: TravelSystemState) -> TravelSystemState:
     """
-    Invoke booker agent to book flights and hotels based on requirements and itinerary.
-    """
-    # NODE ENTRY LOG
-    print(f"\n[BOOKER_AGENT] ===== NODE START =====")
-    print(f"[BOOKER_AGENT] State keys received: {list(state.keys())}")
-    for key in state.keys():
-        value = state.get(key)
-        if value is None:
-            print(f"[BOOKER_AGENT]   {key}: None")
-        elif isinstance(value, (list, dict)):
-            print(f"[BOOKER_AGENT]   {key}: {type(value).__name__} (len={len(value)})")
-        else:
-            print(f"[BOOKER_AGENT]   {key}: {type(value).__name__}")
+    Search hotels for the destination and travel dates in requirements.
 
+    Only depends on requirements, so it runs in parallel with the planner
+    instead of being discovered by the booker agent after the itinerary is done.
+    """
     requirements = state.get("requirements")
-    itinerary = state.get("itinerary")
+    if not requirements:
+        logger.debug("node=hotel_search skipped=no_requirements")
+        return {"hotel_options": None}
 
-    # Format booking context
-    requirements_str = json.dumps(requirements, indent=2)
-    itinerary_str = json.dumps(itinerary, indent=2)
+    trip = requirements.get("trip") or {}
+    city = (trip.get("destination") or {}).get("city")
+    if not city:
+        logger.debug("node=hotel_search skipped=no_destination_city")
+        return {"hotel_options": None}
 
-    booker_prompt = f"""Based on the following requirements and itinerary, book the flights and hotels:
+    search_args = {"city": city}
+    if trip.get("depart_date"):
+        search_args["check_in"] = trip["depart_date"]
+    if trip.get("return_date"):
+        search_args["check_out"] = trip["return_date"]
 
-REQUIREMENTS:
-{requirements_str}
+    hotel_options = await search_hotels.ainvoke(search_args)
 
-ITINERARY:
-{itinerary_str}
+    logger.debug("node=hotel_search city=%s hotels=%s", city, len(hotel_options.get("hotels", [])))
 
-Extract the flight ID from the confirmed flight in requirements and book it.
-For hotels, use the destination city and dates from the itinerary or requirements to book a hotel.
-Return booking confirmations for both flight and hotel."""
+    return {"hotel_options": hotel_options}
 
-    # Invoke booker agent
-    response = booker_agent.invoke({"messages": [HumanMessage(content=booker_prompt)]})
 
-    # Extract structured bookings from response
-    bookings = response["structured_response"].bookings.model_dump()
+async def book_flight_node(state: TravelSystemState) -> TravelSystemState:
+    """
+    Book the confirmed flight. Only needs requirements, so it runs alongside the
+    planner, hotel search and hotel booking.
+    """
+    requirements_str = state.get("requirements_json") or dumps(state.get("requirements"))
+
+    booker_prompt = BOOK_FLIGHT_TASK_PROMPT_TEMPLATE.format(requirements=requirements_str)
+
+    response = await flight_booker_agent.ainvoke({"messages": [HumanMessage(content=booker_prompt)]})
+    flight = response["structured_response"].flight
+    flight_booking = flight.model_dump() if flight else None
+
+    logger.debug("node=book_flight status=%s", (flight_booking or {}).get("status", "none"))
+
+    return {"flight_booking": flight_booking}
+
+
+async def book_hotel_node(state: TravelSystemState) -> TravelSystemState:
+    """
+    Book a hotel from the searched options. Runs in parallel with book_flight_node.
+    """
+    requirements_str = state.get("requirements_json") or dumps(state.get("requirements"))
+    itinerary_str = state.get("itinerary_json") or dumps(state.get("itinerary"))
+    hotel_options_str = dumps(state.get("hotel_options"))
+
+    booker_prompt = BOOK_HOTEL_TASK_PROMPT_TEMPLATE.format(
+        requirements=requirements_str,
+        itinerary=itinerary_str,
+        hotel_options=hotel_options_str,
+    )
+
+    response = await hotel_booker_agent.ainvoke({"messages": [HumanMessage(content=booker_prompt)]})
+    hotel = response["structured_response"].hotel
+    hotel_booking = hotel.model_dump() if hotel else None
+
+    logger.debug("node=book_hotel status=%s", (hotel_booking or {}).get("status", "none"))
+
+    return {"hotel_booking": hotel_booking}
+
+
+def merge_bookings(state: TravelSystemState) -> TravelSystemState:
+    """
+    Combine the flight and hotel bookings and confirm them to the user.
+    """
+    flights = state.get("flight_booking")
+    hotels = state.get("hotel_booking")
+    bookings = {"flights": flights, "hotels": hotels}
 
     # Generate conversational confirmation
-    summary = "Perfect! I've completed your bookings."
+    parts = ["Perfect! I've completed your bookings."]
 
-    if bookings.get('flights'):
-        flight_ref = bookings['flights'].get('reservation_ref', 'N/A')
-        summary += f" Your flight is confirmed (Reference: {flight_ref})."
+    if flights:
+        flight_ref = flights.get('ticket_ref', 'N/A')
+        parts.append(f" Your flight is confirmed (Reference: {flight_ref}).")
 
-    if bookings.get('hotels'):
-        hotel_ref = bookings['hotels'].get('reservation_ref', 'N/A')
-        summary += f" Your hotel reservation is also confirmed (Reference: {hotel_ref})."
+    if hotels:
+        hotel_ref = hotels.get('reservation_ref', 'N/A')
+        parts.append(f" Your hotel reservation is also confirmed (Reference: {hotel_ref}).")
 
-    summary += " All details are shown below. Have a wonderful trip!"
+    parts.append(" All details are shown below. Have a wonderful trip!")
+    summary = "".join(parts)
 
-    # NODE EXIT LOG
-    result = {
+    logger.debug("node=merge_bookings flight=%s hotel=%s", bool(flights), bool(hotels))
+
+    return {
         "messages": [AIMessage(content=summary, name="booker")],
-        "requirements": requirements,
-        "itinerary": itinerary,
         "bookings": bookings,
     }
-    print(f"[BOOKER_AGENT] Returning state update:")
-    for key, value in result.items():
-        if value is None:
-            print(f"[BOOKER_AGENT]   {key}: None")
-        elif isinstance(value, (list, dict)):
-            print(f"[BOOKER_AGENT]   {key}: {type(value).__name__} (len={len(value)})")
-        else:
-            print(f"[BOOKER_AGENT]   {key}: {type(value).__name__}")
-    if bookings:
-        print(f"[BOOKER_AGENT] Bookings keys: {list(bookings.keys())}")
-        if bookings.get('flights'):
-            print(f"[BOOKER_AGENT]   Flight booking: {bookings['flights'].get('status', 'unknown')}")
-        if bookings.get('hotels'):
-            print(f"[BOOKER_AGENT]   Hotel booking: {bookings['hotels'].get('status', 'unknown')}")
-    print(f"[BOOKER_AGENT] ===== NODE COMPLETE =====\n")
 
-    return result
+
+def route_after_requirements(state: TravelSystemState):
+    # Requirements still being gathered -> back to the subgraph node to ask the user
+    if state.get("requirements_question"):
+        return "requirements_subgraph"
+    return ["planner", "hotel_search", "book_flight"]
 
 
 # Build the graph
@@ -287,13 +387,24 @@ graph = StateGraph(TravelSystemState)
 
 graph.add_node("requirements_subgraph", requirements_subgraph_node)
 graph.add_node("planner", planner_agent_node)
-graph.add_node("booker", booker_agent_node)
+graph.add_node("hotel_search", hotel_search_node)
+graph.add_node("book_flight", book_flight_node)
+graph.add_node("book_hotel", book_hotel_node)
+graph.add_node("merge_bookings", merge_bookings)
 
 # Define flow
+# planner, hotel_search and book_flight only need requirements, so they all
+# start together. Hotel booking also needs the itinerary and hotel options, so
+# it waits for planner and hotel_search; merge_bookings waits for both bookings.
 graph.add_edge(START, "requirements_subgraph")
-graph.add_edge("requirements_subgraph", "planner")
-graph.add_edge("planner", "booker")
-graph.add_edge("booker", END)
+graph.add_conditional_edges(
+    "requirements_subgraph",
+    route_after_requirements,
+    ["requirements_subgraph", "planner", "hotel_search", "book_flight"],
+)
+graph.add_edge(["planner", "hotel_search"], "book_hotel")
+graph.add_edge(["book_flight", "book_hotel"], "merge_bookings")
+graph.add_edge("merge_bookings", END)
 
 # Compile the graph
 travel_system_graph = graph.compile(checkpointer=checkpointer)
\ No newline at end of file
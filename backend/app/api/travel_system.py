@@ -1,8 +1,8 @@
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 from app.api.models.travel_system import VercelChatRequest
-from app.api.services.travel_system_streaming_service import stream_travel_system_chat
 from app.utils.http_headers import patch_vercel_headers
+from app.utils.stream_coalesce import coalesce
 from app.utils.message_transformer import extract_user_message
 
 router = APIRouter()
@@ -27,6 +27,10 @@ async def travel_system_chat_streaming(request: VercelChatRequest):
     Compatible with Vercel AI SDK's useChat and useAssistant hooks.
     Supports interrupts for human-in-the-loop workflows.
     """
+    # Imported here so loading the router doesn't pull in the graphs, agents and
+    # LLM clients; sys.modules makes this a dict lookup after the first request
+    from app.api.services.travel_system_streaming_service import stream_travel_system_chat
+
     # Transform UI messages to message string
     message = extract_user_message(request.messages)
 
@@ -35,10 +39,13 @@ async def travel_system_chat_streaming(request: VercelChatRequest):
     print(f"Thread ID: {thread_id}")
 
     response = StreamingResponse(
-        stream_travel_system_chat(
-            message=message,
-            thread_id=thread_id,
-            resume=request.resume
+        # Batch events that arrive within a few ms into one write
+        coalesce(
+            stream_travel_system_chat(
+                message=message,
+                thread_id=thread_id,
+                resume=request.resume
+            )
         ),
         media_type="text/event-stream",
     )
@@ -14,12 +14,15 @@ class Settings(BaseModel):
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL_NAME: str = "gpt-4.1"
     CONVEX_BASE_URL: str = ""
+    CHECKPOINT_DB_PATH: str = "checkpoints.sqlite"
 
 
 settings = Settings(
     OPENAI_API_KEY=os.getenv("OPENAI_API_KEY") or "",
     OPENAI_MODEL_NAME=os.getenv("OPENAI_MODEL_NAME", "gpt-4.1"),
     CONVEX_BASE_URL=os.getenv("CONVEX_BASE_URL") or "",
+    # Empty string keeps checkpoints in memory
+    CHECKPOINT_DB_PATH=os.getenv("CHECKPOINT_DB_PATH", "checkpoints.sqlite"),
 )
 
 # Fail fast if essential keys are missing
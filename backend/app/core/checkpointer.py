@@ -0,0 +1,71 @@
+# app/core/checkpointer.py
+import zlib
+from contextlib import asynccontextmanager
+from typing import Any
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from app.config import settings
+
+
+class CompressedSerializer(SerializerProtocol):
+    """
+    Serializer that zlib-compresses the bytes produced by another serializer.
+
+    Most channel writes (node names, flags, short strings) encode to a few bytes,
+    where zlib's header makes them larger and costs several times the msgpack
+    encode itself, so only payloads of at least min_size bytes are compressed.
+    """
+
+    def __init__(
+        self, serde: SerializerProtocol = JsonPlusSerializer(), min_size: int = 512
+    ) -> None:
+        self.serde = serde
+        self.min_size = min_size
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        typ, data = self.serde.dumps_typed(obj)
+        if len(data) < self.min_size:
+            return typ, data
+        return f"{typ}+zlib", zlib.compress(data, 1)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        typ, payload = data
+        if typ.endswith("+zlib"):
+            return self.serde.loads_typed((typ[: -len("+zlib")], zlib.decompress(payload)))
+        return self.serde.loads_typed(data)
+
+
+# Shared by every compiled graph. Starts in memory; persistent_checkpointer()
+# swaps in the on-disk saver for the lifetime of the app.
+checkpointer = InMemorySaver()
+
+
+@asynccontextmanager
+async def persistent_checkpointer(*graphs):
+    """
+    Point the given compiled graphs at a shared SQLite checkpointer.
+
+    AsyncSqliteSaver needs a running event loop, so it is opened at app startup
+    rather than at import time. Leaves the in-memory saver in place when
+    CHECKPOINT_DB_PATH is empty.
+    """
+    if not settings.CHECKPOINT_DB_PATH:
+        yield checkpointer
+        return
+
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    async with AsyncSqliteSaver.from_conn_string(settings.CHECKPOINT_DB_PATH) as saver:
+        saver.serde = CompressedSerializer()
+        await saver.setup()
+        previous = [graph.checkpointer for graph in graphs]
+        for graph in graphs:
+            graph.checkpointer = saver
+        try:
+            yield saver
+        finally:
+            for graph, original in zip(graphs, previous):
+                graph.checkpointer = original
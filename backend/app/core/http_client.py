@@ -0,0 +1,15 @@
+# app/core/http_client.py
+import httpx
+
+
+# Shared async client for the Convex API, used by the flight and booking tools,
+# so tool calls don't block the event loop and reuse keep-alive connections
+# instead of a new TCP+TLS handshake per call. Transport retries only cover
+# failed connects (the request was never sent), so they are safe for bookings too.
+convex_client = httpx.AsyncClient(
+    timeout=10,
+    transport=httpx.AsyncHTTPTransport(
+        retries=2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    ),
+)
@@ -3,7 +3,36 @@ from langchain_openai import ChatOpenAI
 from app.config import settings
 
 
-model = ChatOpenAI(
+class CachedToolsChatOpenAI(ChatOpenAI):
+    """
+    ChatOpenAI that reuses tool bindings across agent turns.
+
+    create_agent calls bind_tools() with the same tools on every model call,
+    converting each tool's pydantic schema to an OpenAI tool spec each time.
+    The binding is a pure function of the tools and kwargs, so it is built once
+    per combination and reused.
+    """
+
+    def bind_tools(self, tools, **kwargs):
+        try:
+            key = (id(self), tuple(map(id, tools)), tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable kwargs (e.g. a dict tool_choice) - bind without caching
+            return super().bind_tools(tools, **kwargs)
+
+        cached = _bound_tools_cache.get(key)
+        if cached is None:
+            # Keep the tools alive alongside the binding so their ids stay unique
+            cached = (tuple(tools), super().bind_tools(tools, **kwargs))
+            _bound_tools_cache[key] = cached
+        return cached[1]
+
+
+_bound_tools_cache: dict = {}
+
+
+model = CachedToolsChatOpenAI(
     model=settings.OPENAI_MODEL_NAME,
     api_key=settings.OPENAI_API_KEY,
     temperature=0,
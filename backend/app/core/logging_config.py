@@ -0,0 +1,36 @@
+# app/core/logging_config.py
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+_listener: QueueListener | None = None
+
+
+def setup_logging() -> QueueListener:
+    """
+    Route all logging through a queue so formatting and the stdout write happen
+    on a background thread instead of the request's event loop.
+
+    LOG_LEVEL (default INFO) sets the level for this app's loggers. Tool logs are
+    DEBUG, so when they are disabled they cost only a level check.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    logging.getLogger("app").setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
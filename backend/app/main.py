@@ -1,8 +1,32 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.travel_system import router as travel_system_router
-
-app = FastAPI(title="Multi-Agent Travel Planner", version="0.1.0")
+from app.core.logging_config import setup_logging
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Graph imports are deferred to startup so importing app.main (e.g. to dump
+    # the OpenAPI schema) doesn't load LangChain and the LLM clients
+    from app.agents.requirements_graph import compiled_graph as requirements_graph
+    from app.agents.travel_system_graph import travel_system_graph
+    from app.core.checkpointer import persistent_checkpointer
+    from app.core.http_client import convex_client
+
+    listener = setup_logging()
+    try:
+        async with persistent_checkpointer(travel_system_graph, requirements_graph):
+            try:
+                yield
+            finally:
+                await convex_client.aclose()
+    finally:
+        listener.stop()
+
+
+app = FastAPI(title="Multi-Agent Travel Planner", version="0.1.0", lifespan=lifespan)
 
 # Configure CORS for frontend access
 app.add_middleware(
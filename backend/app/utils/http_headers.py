@@ -25,13 +25,14 @@ def patch_vercel_headers(response: StreamingResponse) -> StreamingResponse:
     Headers added:
         - x-vercel-ai-ui-message-stream: Protocol version identifier (v1)
         - x-vercel-ai-protocol: Protocol type (data)
-        - Cache-Control: Prevents caching of streaming responses
+        - Cache-Control: Prevents caching, and (no-transform) proxy compression,
+          of streaming responses
         - Connection: Keeps connection alive for streaming
         - X-Accel-Buffering: Disables nginx buffering for immediate streaming
     """
     response.headers["x-vercel-ai-ui-message-stream"] = "v1"
     response.headers["x-vercel-ai-protocol"] = "data"
-    response.headers["Cache-Control"] = "no-cache"
+    response.headers["Cache-Control"] = "no-cache, no-transform"
     response.headers["Connection"] = "keep-alive"
     response.headers["X-Accel-Buffering"] = "no"
 
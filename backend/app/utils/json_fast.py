@@ -0,0 +1,42 @@
+"""
+Fast JSON serialization helpers backed by orjson (C implementation).
+
+dumps/dumps_pretty return str; dumps_bytes returns UTF-8 bytes for writing
+straight to a response.
+
+Types orjson doesn't handle natively are encoded through their model_dump()
+when they have one (pydantic models, e.g. LangChain messages) and through
+str() otherwise, instead of raising TypeError.
+"""
+
+from typing import Any
+
+import orjson
+
+
+def _default(obj: Any) -> Any:
+    """Encoder fallback for types the serializer doesn't handle natively."""
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump()
+    return str(obj)
+
+
+_dumps = orjson.dumps
+_OPTION = orjson.OPT_NON_STR_KEYS
+_PRETTY_OPTION = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to compact JSON."""
+    return _dumps(obj, default=_default, option=_OPTION).decode()
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact JSON as UTF-8 bytes (no decode round-trip)."""
+    return _dumps(obj, default=_default, option=_OPTION)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize to JSON indented by 2 spaces, for human-readable output."""
+    return _dumps(obj, default=_default, option=_PRETTY_OPTION).decode()
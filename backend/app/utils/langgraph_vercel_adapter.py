@@ -35,18 +35,61 @@ Usage:
 """
 
 import json
-import uuid
+import time
+import asyncio
+import functools
+import random
 import logging
-from typing import AsyncIterator, Dict, Any, Optional, Callable
-from datetime import datetime
+import itertools
+from typing import AsyncIterator, Iterator, Dict, Any, Optional, Callable, Union
 
+from cachetools import LRUCache
 from langgraph.graph import StateGraph
+from langgraph.types import StateSnapshot
 from langchain_core.messages import BaseMessage, AIMessage, ToolMessage
 
+from app.utils.json_fast import dumps_bytes
 from app.utils.message_extractors import default_message_extractor
 
 logger = logging.getLogger(__name__)
 
+# Source of the unique suffix for generated ids. Started at a random offset so
+# ids minted in the same nanosecond by different processes don't collide; much
+# cheaper than formatting a datetime and reading os.urandom for a uuid4 per id.
+_id_counter = itertools.count(random.randrange(1 << 16))
+
+# Tool outputs longer than this are parsed and serialized in a worker thread
+# (see _stream_tool_message) instead of on the event loop
+_OFFLOAD_THRESHOLD_CHARS = 64 * 1024
+
+# What the sync formatting helpers yield: a ready frame, or a deferred one
+SSEFrame = Union[bytes, Callable[[], bytes]]
+
+# Shared default for missing fields, so lookups don't allocate a fresh empty
+# container each time. Never mutated.
+_EMPTY: Dict[str, Any] = {}
+
+# Pre-rendered SSE frames for the fixed-shape events. These are sent for every
+# step and text chunk, so only the genuinely dynamic parts (ids, delta text) are
+# filled in per event instead of serializing a dict each time. Output is
+# byte-identical to _format_sse_event().
+_SSE_FRAME_TEMPLATE = b"data: %b\n\n"
+_START_STEP_EVENT = b'data: {"type":"start-step"}\n\n'
+_FINISH_STEP_EVENT = b'data: {"type":"finish-step"}\n\n'
+_FINISH_EVENT = b'data: {"type":"finish"}\n\n'
+_INTERRUPT_FINISH_EVENT = b'data: {"type":"finish","finishReason":"interrupt"}\n\n'
+_DONE_EVENT = b"data: [DONE]\n\n"
+_START_TEMPLATE = b'data: {"type":"start","messageId":"%b"}\n\n'
+_TEXT_START_TEMPLATE = b'data: {"type":"text-start","id":"%b"}\n\n'
+_TEXT_END_TEMPLATE = b'data: {"type":"text-end","id":"%b"}\n\n'
+_REASONING_START_TEMPLATE = b'data: {"type":"reasoning-start","id":"%b"}\n\n'
+_REASONING_END_TEMPLATE = b'data: {"type":"reasoning-end","id":"%b"}\n\n'
+# Delta text is arbitrary, so it is JSON-encoded on its own (a single scalar)
+_TEXT_DELTA_TEMPLATE = b'data: {"type":"text-delta","id":"%b","delta":%b}\n\n'
+_REASONING_DELTA_TEMPLATE = b'data: {"type":"reasoning-delta","id":"%b","delta":%b}\n\n'
+# Tool ids/names are JSON-encoded per call; the input slot takes cached args JSON
+_TOOL_INPUT_TEMPLATE = b'data: {"type":"tool-input-available","toolCallId":%b,"toolName":%b,"input":%b}\n\n'
+
 
 class LangGraphToVercelAdapter:
     """
@@ -69,7 +112,7 @@ class LangGraphToVercelAdapter:
         self,
         message_extractor: Optional[Callable[[Dict[str, Any]], str]] = None,
         include_reasoning: bool = False,
-        chunk_size: int = 50,
+        chunk_size: int = 512,
         custom_data_fields: Optional[list[str]] = None,
     ):
         """
@@ -80,8 +123,10 @@ class LangGraphToVercelAdapter:
                              Defaults to extracting from messages[-1].content
             include_reasoning: Whether to include reasoning in the stream
                              (for models that support chain-of-thought)
-            chunk_size: Number of characters per text-delta chunk (default: 50).
-                       Larger values reduce overhead, smaller values feel more "real-time".
+            chunk_size: Number of characters per text-delta chunk (default: 512).
+                       Messages reach the adapter complete, so all chunks of a message
+                       are sent in one burst; smaller chunks only add frames and
+                       frontend re-renders, not a more "real-time" feel.
             custom_data_fields: List of state field names to stream as custom data events.
                               E.g., ["requirements", "itinerary"] will emit data-requirements
                               and data-itinerary events. Optional - if None, no custom data
@@ -91,9 +136,19 @@ class LangGraphToVercelAdapter:
         self.include_reasoning = include_reasoning
         self.chunk_size = chunk_size
         self.custom_data_fields = custom_data_fields or []
-        self.current_message_id: Optional[str] = None
-
-    def _format_sse_event(self, data: Dict[str, Any]) -> str:
+        # No per-stream state lives on the instance (ids and dedupe state are
+        # locals of stream()), so one adapter can serve concurrent requests.
+        # Message type -> streaming handler. Types not listed (e.g. HumanMessage,
+        # already shown by the frontend) are skipped.
+        self._message_handlers: Dict[type, Optional[Callable[[BaseMessage], Iterator[SSEFrame]]]] = {
+            AIMessage: self._stream_ai_message,
+            ToolMessage: self._stream_tool_message,
+        }
+        # Serialized tool-call args, keyed by their (hashable) items. Agent loops
+        # repeat the same calls (e.g. the same flight search) across turns.
+        self._tool_input_cache: LRUCache = LRUCache(maxsize=256)
+
+    def _format_sse_event(self, data: Dict[str, Any]) -> bytes:
         """
         Format a dictionary as a Server-Sent Event.
 
@@ -101,25 +156,24 @@ class LangGraphToVercelAdapter:
             data: Dictionary to send as SSE event
 
         Returns:
-            Formatted SSE string
+            Formatted SSE frame as UTF-8 bytes (StreamingResponse sends bytes as-is)
 
         Example:
             >>> adapter._format_sse_event({"type": "text-delta", "delta": "Hello"})
-            'data: {"type":"text-delta","delta":"Hello"}\\n\\n'
+            b'data: {"type":"text-delta","delta":"Hello"}\\n\\n'
         """
-        return f"data: {json.dumps(data)}\n\n"
+        # One formatting pass into a single buffer, no intermediate concatenations
+        return _SSE_FRAME_TEMPLATE % dumps_bytes(data)
 
     def _create_message_id(self) -> str:
         """Generate a unique message ID for Vercel protocol."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        unique_id = uuid.uuid4().hex[:8]
-        return f"msg_{timestamp}_{unique_id}"
+        return f"msg_{time.time_ns():x}_{next(_id_counter):04x}"
 
-    async def _stream_text_chunked(
+    def _stream_text_chunked(
         self,
         content: str,
         message_id: str,
-    ) -> AsyncIterator[str]:
+    ) -> Iterator[bytes]:
         """
         Stream text content in chunks as per Vercel protocol.
 
@@ -136,17 +190,13 @@ class LangGraphToVercelAdapter:
         # Stream content in chunks
         for i in range(0, len(content), self.chunk_size):
             chunk = content[i : i + self.chunk_size]
-            yield self._format_sse_event({
-                "type": "text-delta",
-                "id": message_id,
-                "delta": chunk,
-            })
+            yield _TEXT_DELTA_TEMPLATE % (message_id.encode(), dumps_bytes(chunk))
 
-    async def _stream_reasoning_chunked(
+    def _stream_reasoning_chunked(
         self,
         reasoning: str,
         reasoning_id: str,
-    ) -> AsyncIterator[str]:
+    ) -> Iterator[bytes]:
         """
         Stream reasoning content in chunks as per Vercel protocol.
 
@@ -163,11 +213,7 @@ class LangGraphToVercelAdapter:
         # Stream reasoning in chunks
         for i in range(0, len(reasoning), self.chunk_size):
             chunk = reasoning[i : i + self.chunk_size]
-            yield self._format_sse_event({
-                "type": "reasoning-delta",
-                "id": reasoning_id,
-                "delta": chunk,
-            })
+            yield _REASONING_DELTA_TEMPLATE % (reasoning_id.encode(), dumps_bytes(chunk))
 
     def _extract_reasoning(self, message: BaseMessage) -> Optional[str]:
         """
@@ -185,26 +231,29 @@ class LangGraphToVercelAdapter:
             Reasoning content if found, None otherwise
         """
         # Check for think_content attribute (Claude extended thinking)
-        if hasattr(message, "think_content") and message.think_content:
-            return str(message.think_content)
+        think_content = getattr(message, "think_content", None)
+        if think_content:
+            return str(think_content)
 
         # Check message metadata
-        if hasattr(message, "metadata") and isinstance(message.metadata, dict):
-            if "thinking" in message.metadata:
-                return str(message.metadata["thinking"])
-            if "reasoning" in message.metadata:
-                return str(message.metadata["reasoning"])
+        metadata = getattr(message, "metadata", None)
+        if isinstance(metadata, dict):
+            if "thinking" in metadata:
+                return str(metadata["thinking"])
+            if "reasoning" in metadata:
+                return str(metadata["reasoning"])
 
         # Check response metadata
-        if hasattr(message, "response_metadata") and isinstance(message.response_metadata, dict):
-            if "reasoning" in message.response_metadata:
-                return str(message.response_metadata["reasoning"])
-            if "thinking" in message.response_metadata:
-                return str(message.response_metadata["thinking"])
+        response_metadata = getattr(message, "response_metadata", None)
+        if isinstance(response_metadata, dict):
+            if "reasoning" in response_metadata:
+                return str(response_metadata["reasoning"])
+            if "thinking" in response_metadata:
+                return str(response_metadata["thinking"])
 
         return None
 
-    async def _stream_tool_calls(self, message: BaseMessage) -> AsyncIterator[str]:
+    def _stream_tool_calls(self, message: BaseMessage) -> Iterator[bytes]:
         """
         Stream tool calls from an AI message.
 
@@ -218,11 +267,8 @@ class LangGraphToVercelAdapter:
         Yields:
             tool-input-available and tool-output-available SSE events
         """
-        # Check for tool_calls attribute (LangChain AIMessage with function_call)
-        if not hasattr(message, "tool_calls"):
-            return
-
-        tool_calls = message.tool_calls
+        # LangChain AIMessage tool calls (other message types have none)
+        tool_calls = getattr(message, "tool_calls", None)
         if not tool_calls:
             return
 
@@ -232,59 +278,46 @@ class LangGraphToVercelAdapter:
             # - id: unique tool call ID
             # - name: tool/function name
             # - args: tool arguments (dict)
-            tool_call_id = None
-            tool_name = None
-            tool_input = None
-
             # Handle dict-based tool calls
             if isinstance(tool_call, dict):
-                tool_call_id = tool_call.get("id", uuid.uuid4().hex[:8])
+                tool_call_id = tool_call["id"] if "id" in tool_call else f"call_{next(_id_counter):08x}"
                 tool_name = tool_call.get("name", "unknown")
-                tool_input = tool_call.get("args", {})
+                tool_input = tool_call.get("args") or _EMPTY
             # Handle ToolCall objects from LangChain
-            elif hasattr(tool_call, "id") and hasattr(tool_call, "name"):
-                tool_call_id = tool_call.id
-                tool_name = tool_call.name
-                tool_input = (
-                    tool_call.args if hasattr(tool_call, "args") else
-                    getattr(tool_call, "input", {})
-                )
             else:
-                continue
+                tool_call_id = getattr(tool_call, "id", None)
+                tool_name = getattr(tool_call, "name", None)
+                tool_input = getattr(tool_call, "args", None)
+                if tool_input is None:
+                    tool_input = getattr(tool_call, "input", _EMPTY)
 
             # Stream tool call available event
             if tool_call_id and tool_name:
-                yield self._format_sse_event({
-                    "type": "tool-input-available",
-                    "toolCallId": tool_call_id,
-                    "toolName": tool_name,
-                    "input": tool_input if isinstance(tool_input, dict) else {},
-                })
+                yield _TOOL_INPUT_TEMPLATE % (
+                    dumps_bytes(tool_call_id),
+                    dumps_bytes(tool_name),
+                    self._tool_input_json(tool_input if isinstance(tool_input, dict) else _EMPTY),
+                )
 
-    def _extract_tool_outputs(self, messages: list) -> Dict[str, Any]:
+    def _tool_input_json(self, tool_input: Dict[str, Any]) -> bytes:
         """
-        Extract tool outputs from ToolMessage objects in message history.
-
-        Looks for ToolMessage objects that contain outputs from tool execution
-        and maps them to their corresponding tool call IDs.
-
-        Args:
-            messages: List of messages from the state
+        JSON-encode tool-call args, reusing the encoding of identical args.
 
-        Returns:
-            Dict mapping tool_call_id -> tool output content
+        Args with unhashable values (nested dicts/lists) are encoded every time.
         """
-        tool_outputs = {}
-        for message in messages:
-            if isinstance(message, ToolMessage):
-                # ToolMessage has tool_call_id and content attributes
-                if hasattr(message, "tool_call_id"):
-                    tool_call_id = message.tool_call_id
-                    output = message.content if hasattr(message, "content") else str(message)
-                    tool_outputs[tool_call_id] = output
-        return tool_outputs
-
-    async def _stream_files(self, message: BaseMessage) -> AsyncIterator[str]:
+        try:
+            # The value's type is part of the key so that 1, 1.0 and True
+            # (equal and same-hashed) don't share an encoding
+            key = tuple((name, type(value), value) for name, value in tool_input.items())
+            encoded = self._tool_input_cache.get(key)
+        except TypeError:
+            return dumps_bytes(tool_input)
+
+        if encoded is None:
+            encoded = self._tool_input_cache[key] = dumps_bytes(tool_input)
+        return encoded
+
+    def _stream_files(self, message: BaseMessage) -> Iterator[bytes]:
         """
         Stream file references from a message.
 
@@ -300,25 +333,27 @@ class LangGraphToVercelAdapter:
         files = []
 
         # Check response metadata for files
-        if hasattr(message, "response_metadata") and isinstance(message.response_metadata, dict):
-            if "files" in message.response_metadata:
-                files_data = message.response_metadata["files"]
+        response_metadata = getattr(message, "response_metadata", None)
+        if isinstance(response_metadata, dict):
+            if "files" in response_metadata:
+                files_data = response_metadata["files"]
                 if isinstance(files_data, list):
                     files.extend(files_data)
                 else:
                     files.append(files_data)
 
-            if "attachments" in message.response_metadata:
-                attachments_data = message.response_metadata["attachments"]
+            if "attachments" in response_metadata:
+                attachments_data = response_metadata["attachments"]
                 if isinstance(attachments_data, list):
                     files.extend(attachments_data)
                 else:
                     files.append(attachments_data)
 
         # Check metadata for files
-        if hasattr(message, "metadata") and isinstance(message.metadata, dict):
-            if "files" in message.metadata:
-                files_data = message.metadata["files"]
+        metadata = getattr(message, "metadata", None)
+        if isinstance(metadata, dict):
+            if "files" in metadata:
+                files_data = metadata["files"]
                 if isinstance(files_data, list):
                     files.extend(files_data)
                 else:
@@ -342,7 +377,7 @@ class LangGraphToVercelAdapter:
                     "mediaType": "application/octet-stream",
                 })
 
-    async def _stream_sources(self, message: BaseMessage) -> AsyncIterator[str]:
+    def _stream_sources(self, message: BaseMessage) -> Iterator[bytes]:
         """
         Stream source references from a message.
 
@@ -358,33 +393,35 @@ class LangGraphToVercelAdapter:
         sources = []
 
         # Check response metadata for sources
-        if hasattr(message, "response_metadata") and isinstance(message.response_metadata, dict):
+        response_metadata = getattr(message, "response_metadata", None)
+        if isinstance(response_metadata, dict):
             # Look for common source fields
-            if "sources" in message.response_metadata:
-                sources_data = message.response_metadata["sources"]
+            if "sources" in response_metadata:
+                sources_data = response_metadata["sources"]
                 if isinstance(sources_data, list):
                     sources.extend(sources_data)
                 else:
                     sources.append(sources_data)
 
-            if "documents" in message.response_metadata:
-                docs_data = message.response_metadata["documents"]
+            if "documents" in response_metadata:
+                docs_data = response_metadata["documents"]
                 if isinstance(docs_data, list):
                     sources.extend(docs_data)
                 else:
                     sources.append(docs_data)
 
-            if "citations" in message.response_metadata:
-                citations_data = message.response_metadata["citations"]
+            if "citations" in response_metadata:
+                citations_data = response_metadata["citations"]
                 if isinstance(citations_data, list):
                     sources.extend(citations_data)
                 else:
                     sources.append(citations_data)
 
         # Check metadata for sources
-        if hasattr(message, "metadata") and isinstance(message.metadata, dict):
-            if "sources" in message.metadata:
-                sources_data = message.metadata["sources"]
+        metadata = getattr(message, "metadata", None)
+        if isinstance(metadata, dict):
+            if "sources" in metadata:
+                sources_data = metadata["sources"]
                 if isinstance(sources_data, list):
                     sources.extend(sources_data)
                 else:
@@ -392,7 +429,7 @@ class LangGraphToVercelAdapter:
 
         # Stream each source
         for idx, source in enumerate(sources):
-            source_id = f"src_{uuid.uuid4().hex[:8]}"
+            source_id = f"src_{next(_id_counter):08x}"
 
             if isinstance(source, dict):
                 # Handle dict-based sources
@@ -424,7 +461,7 @@ class LangGraphToVercelAdapter:
         graph: StateGraph,
         initial_state: Dict[str, Any],
         config: Dict[str, Any],
-    ) -> AsyncIterator[str]:
+    ) -> AsyncIterator[bytes]:
         """
         Stream LangGraph execution as Vercel Data Stream Protocol events.
 
@@ -437,7 +474,8 @@ class LangGraphToVercelAdapter:
             config: Configuration dict (must include thread_id in configurable)
 
         Yields:
-            SSE-formatted strings ready to send to the frontend
+            SSE-formatted bytes ready to send to the frontend. Frames produced
+            together (e.g. all events for one node update) are joined into one chunk.
 
         Note on HTTP Headers:
             When using this in an HTTP response, ensure you set these headers:
@@ -447,243 +485,367 @@ class LangGraphToVercelAdapter:
 
         Example:
             async for event in adapter.stream(my_graph, initial_state, config):
-                # event is like: 'data: {"type":"text-delta","delta":"Hello"}\\n\\n'
+                # event is like: b'data: {"type":"text-delta","delta":"Hello"}\\n\\n'
                 response.write(event)
         """
         # Stream the graph execution
-        logger.info(f"[ADAPTER] Starting stream with config: {config}")
-        logger.info(f"[ADAPTER] Initial state type: {type(initial_state)}")
-
-        try:
-            chunk_count = 0
-            async for chunk in graph.astream(
-                initial_state,
-                config,
-                stream_mode="values",
-            ):
-                chunk_count += 1
-                print(f"\n[ADAPTER] ===== Received chunk #{chunk_count} =====")
-                print(f"[ADAPTER] Chunk type: {type(chunk)}")
-                print(f"[ADAPTER] Chunk keys: {list(chunk.keys())}")
-                logger.info(f"[ADAPTER] Received chunk #{chunk_count}: {list(chunk.keys())}")
-
-                # chunk is the state dict itself
-                async for sse_event in self._handle_node_update(chunk):
-                    logger.info(f"[ADAPTER] Yielding SSE event: {sse_event[:100]}...")
-                    yield sse_event
-
-            logger.info(f"[ADAPTER] Stream completed. Total chunks: {chunk_count}")
-
-            # Send finish event after successful completion
-            yield self._format_sse_event({
-                "type": "finish",
-            })
-
-            # Terminate stream with [DONE]
-            yield "data: [DONE]\n\n"
+        logger.info("[ADAPTER] Starting stream with config: %s", config)
+        logger.debug("[ADAPTER] Initial state type: %s", type(initial_state))
+
+        # Last value sent per custom data field, and text sent per message id,
+        # so unchanged fields and re-emitted messages aren't re-sent
+        sent_data: Dict[str, Any] = {}
+        sent_text: Dict[str, str] = {}
+
+        # One assistant message per response (per Vercel protocol); each node's
+        # output is a step inside it
+        yield _START_TEMPLATE % self._create_message_id().encode()
+
+        chunk_count = 0
+        # "updates" yields only what each node returned ({node_name: update}),
+        # instead of re-sending the whole accumulated state after every node.
+        # output_keys drops channels the adapter never reads before LangGraph
+        # builds each update. LLM calls in this app's graphs all run nested
+        # inside nodes (subgraphs, create_agent), so "messages" mode would yield
+        # no tokens here without subgraphs=True; it isn't requested.
+        updates = graph.astream(
+            initial_state,
+            config,
+            stream_mode="updates",
+            output_keys=self._output_keys(graph),
+        )
+
+        # Resolve per-iteration lookups once
+        next_chunk = updates.__anext__
+        handle_node_update = self._handle_node_update
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        while True:
+            # Only the graph run itself is guarded: an error there becomes an
+            # error event, while cancellation (not an Exception) propagates as-is
+            try:
+                chunk = await next_chunk()
+            except StopAsyncIteration:
+                break
+            except Exception as e:
+                logger.error("[ADAPTER] Error during streaming: %s", e, exc_info=True)
+                # Send error event
+                yield self._format_sse_event({
+                    "type": "error",
+                    "errorText": str(e),
+                })
+                return
+
+            chunk_count += 1
+            if debug:
+                logger.debug("[ADAPTER] Received chunk #%s: %s", chunk_count, list(chunk.keys()))
+
+            # All frames for one chunk are ready at once, so they go out as a
+            # single yield (one ASGI send) before the graph is awaited again
+            frames: list[bytes] = []
+            for node_name, update in chunk.items():
+                if node_name == "__interrupt__":
+                    frames.extend(self._handle_interrupt({"__interrupt__": update}))
+                    continue
+
+                # Nodes that write nothing produce a None update
+                if not isinstance(update, dict):
+                    continue
+
+                for sse_event in handle_node_update(update, sent_data, sent_text):
+                    if isinstance(sse_event, bytes):
+                        frames.append(sse_event)
+                        continue
+                    # Oversized payload: flush what's ready, then serialize it
+                    # off the event loop and send it on its own
+                    if frames:
+                        yield b"".join(frames)
+                        frames = []
+                    yield await asyncio.to_thread(sse_event)
+
+            if frames:
+                if debug:
+                    logger.debug("[ADAPTER] Yielding %s SSE events: %s...", len(frames), frames[0][:100])
+                yield b"".join(frames)
+
+        logger.info("[ADAPTER] Stream completed. Total chunks: %s", chunk_count)
+
+        # Send finish event after successful completion, then terminate the
+        # stream with [DONE]
+        yield _FINISH_EVENT + _DONE_EVENT
+
+    def _output_keys(self, graph: Any) -> Optional[list[str]]:
+        """
+        State channels the adapter streams: messages plus the custom data fields.
 
-        except Exception as e:
-            logger.error(f"[ADAPTER] Error during streaming: {e}", exc_info=True)
-            # Send error event
-            yield self._format_sse_event({
-                "type": "error",
-                "errorText": str(e),
-            })
-            return
+        Returns None (all channels) when the graph doesn't expose its channels or
+        has none of these, so the adapter still works with any graph.
+        """
+        channels = getattr(graph, "channels", None)
+        if not channels:
+            return None
+        keys = [key for key in ("messages", *self.custom_data_fields) if key in channels]
+        return keys or None
 
-    async def _handle_node_update(self, chunk: Dict[str, Any]) -> AsyncIterator[str]:
+    def _handle_node_update(
+        self,
+        chunk: Dict[str, Any],
+        sent_data: Optional[Dict[str, Any]] = None,
+        sent_text: Optional[Dict[str, str]] = None,
+    ) -> Iterator[SSEFrame]:
         """
-        Process state from astream(stream_mode="values").
+        Process one node's update from astream(stream_mode="updates").
 
         Args:
-            chunk: The state dict itself (not wrapped in node names)
-                  Format: {'messages': [...], 'requirements': ..., 'itinerary': ..., 'bookings': ...}
+            chunk: The state update returned by a single node (already unwrapped
+                  from its node name). Contains only the keys that node wrote, e.g.
+                  {'messages': [AIMessage(...)], 'itinerary': {...}}
+            sent_data: Custom data field values already sent in this stream. Fields whose
+                      value hasn't changed since are skipped; updated in place.
+            sent_text: Text already sent per message id in this stream. A message
+                      re-emitted under the same id only streams the text added since;
+                      updated in place.
 
         Yields:
-            SSE-formatted event strings
+            SSE-formatted event bytes, or a zero-arg callable producing them for
+            payloads too large to serialize on the event loop
         """
-        # With stream_mode="values", chunk IS the state dict
         state = chunk
-        print(f"[STATE] Processing state with keys: {list(state.keys())}")
-        logger.info(f"[STATE] Processing state with keys: {list(state.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[STATE] Processing state with keys: %s", list(state.keys()))
 
         # Check for interrupt first
         if "__interrupt__" in state:
-            print(f"[STATE] Interrupt detected")
-            logger.info(f"[STATE] Interrupt detected")
-            async for sse_event in self._handle_interrupt(state):
-                yield sse_event
+            logger.debug("[STATE] Interrupt detected")
+            yield from self._handle_interrupt(state)
             return  # Stop processing after interrupt
 
-        # Extract and stream messages
-        if "messages" in state:
-            messages = state["messages"]
-            print(f"[STATE] Found {len(messages) if messages else 0} messages")
-            logger.info(f"[STATE] Found {len(messages) if messages else 0} messages")
-
-            if messages:
-                # Mark the start of a step (LLM reasoning/response generation)
-                yield self._format_sse_event({
-                    "type": "start-step",
-                })
-                # Get the last message (most recent addition)
-                last_message = messages[-1]
-                print(f"[STATE] Last message type: {type(last_message)}")
-                logger.info(f"[STATE] Last message type: {type(last_message)}")
-
-                # Handle different message types
-                # AIMessage: AI responses
-                # ToolMessage: Tool execution results
-                # Skip HumanMessage (already in frontend)
-                should_stream = isinstance(last_message, (AIMessage, ToolMessage))
-
-                if not should_stream:
-                    message_type = type(last_message).__name__
-                    print(f"[STATE] Skipping {message_type} message (only stream AI and Tool messages)")
-                    logger.info(f"[STATE] Skipping {message_type} message (only stream AI and Tool messages)")
-                    return  # Don't stream user messages
-
-                # Special handling for ToolMessage: emit tool-output-available
-                if isinstance(last_message, ToolMessage):
-                    tool_call_id = getattr(last_message, 'tool_call_id', None)
-                    if tool_call_id:
-                        content = None
-                        if isinstance(last_message, BaseMessage):
-                            content = last_message.content
-                        elif isinstance(last_message, dict):
-                            content = last_message.get("content", "")
-                        else:
-                            content = str(last_message)
-
-                        # Try to parse as JSON if it looks like JSON
-                        tool_output = content
-                        if content and content.strip():
-                            try:
-                                tool_output = json.loads(content)
-                            except (json.JSONDecodeError, ValueError):
-                                # Not valid JSON, use as string
-                                tool_output = content
-
-                        print(f"[STATE] Emitting tool-output-available for tool_call_id: {tool_call_id}")
-                        logger.info(f"[STATE] Emitting tool-output-available for tool_call_id: {tool_call_id}")
-
-                        yield self._format_sse_event({
-                            "type": "tool-output-available",
-                            "toolCallId": tool_call_id,
-                            "output": tool_output,
-                        })
-
-                        # Mark the end of the step
-                        yield self._format_sse_event({
-                            "type": "finish-step",
-                        })
-                        return  # Don't continue with regular text streaming
-
-                # Extract content from message
-                content = None
-                if isinstance(last_message, BaseMessage):
-                    content = last_message.content
-                elif isinstance(last_message, dict):
-                    content = last_message.get("content", "")
+        # Extract and stream messages. Many updates (data-only nodes) carry no
+        # messages at all, so that case skips straight to the custom data fields.
+        messages = state.get("messages")
+        if isinstance(messages, BaseMessage):
+            messages = [messages]
+
+        if messages:
+            logger.debug("[STATE] Found %s messages", len(messages))
+
+            # Get the last message (most recent addition)
+            last_message = messages[-1]
+            logger.debug("[STATE] Last message type: %s", type(last_message))
+
+            handler = self._message_handler(last_message)
+            previous_text = self._record_sent_text(last_message, sent_text)
+            if handler is None:
+                # Only AI and Tool messages are streamed (HumanMessage is already in frontend)
+                message_type = type(last_message).__name__
+                logger.debug("[STATE] Skipping %s message (only stream AI and Tool messages)", message_type)
+            elif previous_text is not None:
+                # Same message id seen before: send only what was appended since
+                content = last_message.content
+                suffix = content[len(previous_text):] if content.startswith(previous_text) else content
+                if suffix and not suffix.isspace():
+                    yield _START_STEP_EVENT
+                    yield from self._stream_text_part(suffix)
+                    yield _FINISH_STEP_EVENT
                 else:
-                    content = str(last_message)
+                    logger.debug("[STATE] Message %s already streamed", last_message.id)
+            else:
+                # Mark the start of a step (LLM reasoning/response generation)
+                yield _START_STEP_EVENT
+                yield from handler(last_message)
+                # Mark the end of the step
+                yield _FINISH_STEP_EVENT
+        else:
+            logger.debug("[STATE] No messages in update")
 
-                print(f"[STATE] Extracted content length: {len(content) if content else 0}")
-                logger.info(f"[STATE] Extracted content length: {len(content) if content else 0}")
-                if content:
-                    print(f"[STATE] Content preview: {content[:100]}")
-                    logger.info(f"[STATE] Content preview: {content[:100]}")
+        # Stream custom data fields if configured
+        # This allows graph-specific data to be sent alongside messages
+        if sent_data is None:
+            sent_data = {}
+        for field in self.custom_data_fields:
+            value = state.get(field)
+            if not value:
+                continue
+            previous = sent_data.get(field)
+            if previous is value or previous == value:
+                continue  # Frontend already has this value
+            sent_data[field] = value
+            yield self._format_sse_event({
+                "type": f"data-{field}",
+                "data": value,
+            })
 
-                # Create unique message ID for this message
-                message_id = self._create_message_id()
-                print(f"[STATE] Streaming message with ID: {message_id}")
-                logger.info(f"[STATE] Streaming message with ID: {message_id}")
+    @staticmethod
+    def _record_sent_text(
+        message: Any, sent_text: Optional[Dict[str, str]]
+    ) -> Optional[str]:
+        """
+        Remember the text streamed for a message id.
 
-                # Always send message start event (per Vercel protocol)
-                # This happens regardless of whether there's text content
-                yield self._format_sse_event({
-                    "type": "start",
-                    "messageId": message_id,
-                })
+        Tool results often have no message id; they are tracked by their
+        tool_call_id instead, so a re-surfaced result isn't sent twice.
 
-                # Stream reasoning if available and enabled (AIMessage only)
-                if self.include_reasoning and isinstance(last_message, AIMessage):
-                    reasoning = self._extract_reasoning(last_message)
-                    if reasoning and reasoning.strip():
-                        reasoning_id = self._create_message_id()
-                        print(f"[STATE] Streaming reasoning with ID: {reasoning_id}")
-                        logger.info(f"[STATE] Streaming reasoning with ID: {reasoning_id}")
-
-                        # Send reasoning-start event
-                        yield self._format_sse_event({
-                            "type": "reasoning-start",
-                            "id": reasoning_id,
-                        })
-
-                        # Stream reasoning in chunks
-                        async for chunk_event in self._stream_reasoning_chunked(reasoning, reasoning_id):
-                            yield chunk_event
-
-                        # Send reasoning-end event
-                        yield self._format_sse_event({
-                            "type": "reasoning-end",
-                            "id": reasoning_id,
-                        })
-
-                # Stream tool calls if present (AIMessage only)
-                if isinstance(last_message, AIMessage):
-                    async for tool_event in self._stream_tool_calls(last_message):
-                        yield tool_event
-
-                # Stream file and source references (AIMessage and ToolMessage)
-                async for file_event in self._stream_files(last_message):
-                    yield file_event
-
-                async for source_event in self._stream_sources(last_message):
-                    yield source_event
-
-                # Stream text content only if available
-                if content and content.strip():
-                    # Send text-start event
-                    yield self._format_sse_event({
-                        "type": "text-start",
-                        "id": message_id,
-                    })
+        Returns the text previously sent under the same id, or None if this
+        message hasn't been streamed yet (or can't be tracked: no id or non-text
+        content).
+        """
+        if sent_text is None:
+            return None
+        message_id = getattr(message, "id", None) or getattr(message, "tool_call_id", None)
+        content = getattr(message, "content", None)
+        if not message_id or not isinstance(content, str):
+            return None
+        previous = sent_text.get(message_id)
+        sent_text[message_id] = content
+        return previous
+
+    def _message_handler(
+        self, message: Any
+    ) -> Optional[Callable[[BaseMessage], Iterator[SSEFrame]]]:
+        """
+        Look up the streaming handler for a message's type.
 
-                    # Stream content in chunks
-                    async for chunk_event in self._stream_text_chunked(content, message_id):
-                        yield chunk_event
+        Exact types hit the table directly; other types (e.g. AIMessageChunk,
+        HumanMessage) are resolved through their MRO once and the result - a
+        handler or None for types that aren't streamed - is cached in the table,
+        so every later message of that type is a single dict lookup.
+        """
+        handlers = self._message_handlers
+        message_type = type(message)
+        try:
+            return handlers[message_type]
+        except KeyError:
+            pass
+
+        handler = next(
+            (handlers[cls] for cls in message_type.__mro__[1:] if cls in handlers),
+            None,
+        )
+        handlers[message_type] = handler
+        return handler
+
+    def _stream_ai_message(self, message: AIMessage) -> Iterator[bytes]:
+        """
+        Stream an AI message: reasoning (if enabled), tool calls, then its body.
 
-                    # Send text-end event
-                    yield self._format_sse_event({
-                        "type": "text-end",
-                        "id": message_id,
-                    })
-                else:
-                    if content:
-                        logger.warning(f"[STATE] Content is empty or whitespace only")
-                    else:
-                        logger.info(f"[STATE] No text content (may have reasoning/tools/files only)")
+        Yields:
+            SSE-formatted event bytes
+        """
+        # Stream reasoning if available and enabled
+        if self.include_reasoning:
+            reasoning = self._extract_reasoning(message)
+            if reasoning and not reasoning.isspace():
+                reasoning_id = self._create_message_id()
+                logger.debug("[STATE] Streaming reasoning with ID: %s", reasoning_id)
 
-                # Mark the end of the step
-                yield self._format_sse_event({
-                    "type": "finish-step",
-                })
-            else:
-                logger.warning(f"[STATE] Messages array is empty")
+                # Send reasoning-start event
+                yield _REASONING_START_TEMPLATE % reasoning_id.encode()
+
+                # Stream reasoning in chunks
+                yield from self._stream_reasoning_chunked(reasoning, reasoning_id)
+
+                # Send reasoning-end event
+                yield _REASONING_END_TEMPLATE % reasoning_id.encode()
+
+        # Stream tool calls if present
+        yield from self._stream_tool_calls(message)
+
+        yield from self._stream_message_body(message)
+
+    def _stream_tool_message(self, message: ToolMessage) -> Iterator[SSEFrame]:
+        """
+        Stream a tool result as tool-output-available.
+
+        Tool messages without a tool_call_id can't be matched to a call, so they
+        are streamed like any other message body.
+
+        Yields:
+            SSE-formatted event bytes. Oversized outputs are yielded as a
+            zero-arg callable producing the bytes, which stream() runs in a
+            worker thread so parsing/serializing them doesn't stall the event loop.
+        """
+        tool_call_id = getattr(message, 'tool_call_id', None)
+        if not tool_call_id:
+            yield from self._stream_message_body(message)
+            return
+
+        logger.debug("[STATE] Emitting tool-output-available for tool_call_id: %s", tool_call_id)
+
+        content = message.content
+        if isinstance(content, str) and len(content) > _OFFLOAD_THRESHOLD_CHARS:
+            yield functools.partial(self._format_tool_output, tool_call_id, content)
         else:
-            logger.warning(f"[STATE] No 'messages' key in state")
+            yield self._format_tool_output(tool_call_id, content)
+
+    def _format_tool_output(self, tool_call_id: str, content: Any) -> bytes:
+        """Format a tool-output-available frame, decoding JSON tool output when possible."""
+        # Try to parse as JSON if it looks like JSON
+        tool_output = content
+        if isinstance(content, str) and content and not content.isspace():
+            try:
+                tool_output = json.loads(content)
+            except (json.JSONDecodeError, ValueError):
+                # Not valid JSON, use as string
+                tool_output = content
+
+        return self._format_sse_event({
+            "type": "tool-output-available",
+            "toolCallId": tool_call_id,
+            "output": tool_output,
+        })
 
-        # Stream custom data fields if configured
-        # This allows graph-specific data to be sent alongside messages
-        for field in self.custom_data_fields:
-            if field in state and state[field]:
-                yield self._format_sse_event({
-                    "type": f"data-{field}",
-                    "data": state[field],
-                })
+    def _stream_message_body(self, message: BaseMessage) -> Iterator[bytes]:
+        """
+        Stream a message's file and source references and its text content.
+
+        Yields:
+            SSE-formatted event bytes
+        """
+        content = message.content
+
+        # File and source references live in the metadata dicts; most messages
+        # (e.g. locally built summaries) have neither, so skip both scans then
+        if message.response_metadata or getattr(message, "metadata", None):
+            yield from self._stream_files(message)
+
+            yield from self._stream_sources(message)
+
+        # Tool-call-only AI messages have no text: nothing more to format
+        if not content:
+            logger.debug("[STATE] No text content (may have reasoning/tools/files only)")
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[STATE] Extracted content length: %s", len(content))
+            logger.debug("[STATE] Content preview: %s", content[:100])
+
+        # Stream text content only if available
+        if not content.isspace():
+            yield from self._stream_text_part(content)
+        else:
+            logger.warning("[STATE] Content is empty or whitespace only")
 
-    async def _handle_interrupt(self, state_update: Dict[str, Any]) -> AsyncIterator[str]:
+    def _stream_text_part(self, content: str) -> Iterator[bytes]:
+        """
+        Stream text as one text part: text-start, chunked text-deltas, text-end.
+
+        Yields:
+            SSE-formatted event bytes
+        """
+        # Create unique ID for this message's text part
+        message_id = self._create_message_id()
+        logger.debug("[STATE] Streaming message with ID: %s", message_id)
+
+        # Send text-start event
+        yield _TEXT_START_TEMPLATE % message_id.encode()
+
+        # Stream content in chunks
+        yield from self._stream_text_chunked(content, message_id)
+
+        # Send text-end event
+        yield _TEXT_END_TEMPLATE % message_id.encode()
+
+    def _handle_interrupt(self, state_update: Dict[str, Any]) -> Iterator[bytes]:
         """
         Handle graph interruption (human-in-the-loop).
 
@@ -697,69 +859,35 @@ class LangGraphToVercelAdapter:
         Yields:
             Text events with interrupt message, then finish event
         """
-        interrupt_list = state_update.get("__interrupt__", [])
-        print(f"[INTERRUPT] Interrupt list length: {len(interrupt_list) if isinstance(interrupt_list, list) else 'N/A'}")
-        logger.info(f"[INTERRUPT] Interrupt list type: {type(interrupt_list)}, length: {len(interrupt_list) if isinstance(interrupt_list, list) else 'N/A'}")
+        interrupts = state_update.get("__interrupt__")
+        logger.debug("[INTERRUPT] Interrupt payload type: %s", type(interrupts))
 
         # Extract the interrupt message from the Interrupt object
-        # Format: [Interrupt(value="message")]
+        # Format: (Interrupt(value="message"),); Interrupt objects carry it in .value,
+        # anything else falls back to its string representation
         interrupt_message = ""
-        if interrupt_list:
-            interrupt_obj = interrupt_list[0]
-            logger.info(f"[INTERRUPT] Interrupt object type: {type(interrupt_obj)}")
-
-            # Interrupt objects have a .value attribute
-            if hasattr(interrupt_obj, "value"):
-                interrupt_message = str(interrupt_obj.value)
-                print(f"[INTERRUPT] Extracted message: {interrupt_message[:100]}...")
-                logger.info(f"[INTERRUPT] Extracted message from .value: {interrupt_message}")
-            else:
-                # Fallback if structure is different
-                interrupt_message = str(interrupt_obj)
-                logger.info(f"[INTERRUPT] Using string representation: {interrupt_message}")
+        if interrupts:
+            try:
+                first = interrupts[0]
+            except (TypeError, IndexError, KeyError):
+                first = interrupts
+            interrupt_message = str(getattr(first, "value", first))
+            logger.debug("[INTERRUPT] Extracted message: %s", interrupt_message)
 
         # Stream the interrupt message as text events (so frontend displays it)
         if interrupt_message:
-            message_id = self._create_message_id()
-            print(f"[INTERRUPT] Streaming interrupt message with ID: {message_id}")
-            logger.info(f"[INTERRUPT] Streaming interrupt message with ID: {message_id}")
-
-            # Send message start event (per Vercel protocol)
-            yield self._format_sse_event({
-                "type": "start",
-                "messageId": message_id,
-            })
-
-            # Send text-start event
-            yield self._format_sse_event({
-                "type": "text-start",
-                "id": message_id,
-            })
-
-            # Stream interrupt message in chunks
-            async for chunk_event in self._stream_text_chunked(interrupt_message, message_id):
-                yield chunk_event
-
-            # Send text-end event
-            yield self._format_sse_event({
-                "type": "text-end",
-                "id": message_id,
-            })
+            yield from self._stream_text_part(interrupt_message)
 
         # Send finish event with interrupt reason
-        print(f"[INTERRUPT] Sending finish event")
-        logger.info(f"[INTERRUPT] Sending finish event with interrupt reason")
-        yield self._format_sse_event({
-            "type": "finish",
-            "finishReason": "interrupt",
-        })
+        logger.debug("[INTERRUPT] Sending finish event with interrupt reason")
+        yield _INTERRUPT_FINISH_EVENT
 
     async def stream_with_final_state(
         self,
         graph: StateGraph,
         initial_state: Dict[str, Any],
         config: Dict[str, Any],
-    ) -> tuple[AsyncIterator[str], Dict[str, Any]]:
+    ) -> tuple[AsyncIterator[bytes], "asyncio.Future[StateSnapshot]"]:
         """
         Stream execution and return final state.
 
@@ -772,17 +900,38 @@ class LangGraphToVercelAdapter:
             config: Configuration dict
 
         Returns:
-            Tuple of (event iterator, final state dict)
+            Tuple of (event iterator, future for the final StateSnapshot). The
+            future resolves once the iterator has been fully drained; it is
+            cancelled if the iterator is closed early.
+
+        Example:
+            events, final_state = await adapter.stream_with_final_state(graph, state, config)
+            async for event in events:
+                ...
+            snapshot = await final_state
         """
-        final_state = None
+        final_state: asyncio.Future = asyncio.get_running_loop().create_future()
 
         async def _stream_and_capture():
-            nonlocal final_state
-            async for event in self.stream(graph, initial_state, config):
-                yield event
-
-            # Capture final state after streaming completes
-            final_state = await graph.aget_state(config)
+            state_task: Optional[asyncio.Task] = None
+            try:
+                async for event in self.stream(graph, initial_state, config):
+                    if event.endswith(_DONE_EVENT):
+                        # The graph run is over: read the checkpoint while the
+                        # last frames are being sent instead of after
+                        state_task = asyncio.create_task(graph.aget_state(config))
+                    yield event
+
+                # Capture final state after streaming completes
+                try:
+                    final_state.set_result(await (state_task or graph.aget_state(config)))
+                except Exception as e:
+                    final_state.set_exception(e)
+            finally:
+                if state_task is not None and not state_task.done():
+                    state_task.cancel()
+                if not final_state.done():
+                    final_state.cancel()
 
         return _stream_and_capture(), final_state
 
@@ -794,7 +943,7 @@ async def stream_langgraph_to_vercel(
     config: Dict[str, Any],
     message_extractor: Optional[Callable] = None,
     custom_data_fields: Optional[list[str]] = None,
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     """
     Convenience function to stream a LangGraph graph to Vercel protocol.
 
@@ -808,7 +957,7 @@ async def stream_langgraph_to_vercel(
                           and data-itinerary events.
 
     Yields:
-        SSE-formatted event strings
+        SSE-formatted event bytes
 
     Example:
         async for event in stream_langgraph_to_vercel(
@@ -817,9 +966,18 @@ async def stream_langgraph_to_vercel(
         ):
             yield event
     """
-    adapter = LangGraphToVercelAdapter(
-        message_extractor=message_extractor,
-        custom_data_fields=custom_data_fields,
-    )
+    adapter = _shared_adapter(message_extractor, tuple(custom_data_fields or ()))
     async for event in adapter.stream(graph, initial_state, config):
         yield event
+
+
+@functools.lru_cache(maxsize=32)
+def _shared_adapter(
+    message_extractor: Optional[Callable],
+    custom_data_fields: tuple[str, ...],
+) -> LangGraphToVercelAdapter:
+    """One adapter per configuration, reused across requests (the adapter is stateless per stream)."""
+    return LangGraphToVercelAdapter(
+        message_extractor=message_extractor,
+        custom_data_fields=list(custom_data_fields),
+    )
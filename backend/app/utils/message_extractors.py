@@ -6,10 +6,11 @@ LangGraph state, allowing developers to customize how messages are pulled
 from their graph without modifying the adapter.
 """
 
-import json
 from typing import Dict, Any, Optional, Callable
 from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
 
+from app.utils.json_fast import dumps_pretty
+
 
 def default_message_extractor(state: Dict[str, Any]) -> str:
     """
@@ -29,7 +30,7 @@ def default_message_extractor(state: Dict[str, Any]) -> str:
         >>> default_message_extractor(state)
         'Hello world'
     """
-    messages = state.get("messages", [])
+    messages = state.get("messages")
     if not messages:
         return ""
 
@@ -72,7 +73,7 @@ def structured_data_extractor(field_name: str = "result") -> Callable:
             return data
 
         # Otherwise, serialize to JSON
-        return json.dumps(data, indent=2)
+        return dumps_pretty(data)
 
     return extractor
 
@@ -106,7 +107,7 @@ def multi_field_extractor(fields: list[str], separator: str = "\n\n") -> Callabl
                 if isinstance(value, str):
                     parts.append(value)
                 else:
-                    parts.append(json.dumps(value, indent=2))
+                    parts.append(dumps_pretty(value))
 
         return separator.join(parts)
 
@@ -176,7 +177,7 @@ class MessageExtractorChain:
         """
         for extractor in self.extractors:
             result = extractor(state)
-            if result and result.strip():
+            if result and not result.isspace():
                 return result
 
         return ""
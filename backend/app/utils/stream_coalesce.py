@@ -0,0 +1,95 @@
+"""
+Coalescing wrapper for SSE event streams.
+
+StreamingResponse sends every yielded item as its own ASGI body message (and
+usually its own socket write), so this module batches events that arrive close
+together into one chunk.
+"""
+
+import asyncio
+import contextlib
+from typing import AsyncIterable, AsyncIterator, TypeVar
+
+AnyStr = TypeVar("AnyStr", str, bytes)
+
+_END = object()
+
+
+async def coalesce(
+    events: AsyncIterable[AnyStr],
+    max_bytes: int = 8192,
+    max_delay_ms: int = 5,
+) -> AsyncIterator[AnyStr]:
+    """
+    Re-yield an event stream in batches.
+
+    A batch is flushed once it reaches max_bytes or max_delay_ms after its first
+    event arrived, whichever comes first, so a lone event is delayed by at most
+    max_delay_ms.
+
+    The adapter streams node updates only and already joins each update's frames
+    into one event, so events are either seconds apart (an LLM call in between)
+    or back to back: parallel nodes finishing in the same step, or the last
+    update followed by the finish frames. 5 ms is enough to catch the back-to-back
+    case without adding noticeable latency to the rest. 8 KiB holds a typical
+    step including its data-* payloads (itinerary, bookings) in one write.
+
+    The source is consumed by a separate task, which keeps the source generator
+    running in a single task and lets the timeout never cancel it mid-event.
+
+    Args:
+        events: Async iterable of SSE-formatted str (or bytes) events
+        max_bytes: Flush once the buffered events reach this size
+        max_delay_ms: Flush at most this long after the first buffered event
+
+    Yields:
+        Concatenated events, in their original order
+    """
+    loop = asyncio.get_running_loop()
+    max_delay = max_delay_ms / 1000
+    # Bounded so a slow client applies backpressure to the producer
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+    error: BaseException | None = None
+
+    async def produce() -> None:
+        nonlocal error
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as exc:
+            error = exc
+        await queue.put(_END)
+
+    producer = asyncio.create_task(produce())
+    try:
+        finished = False
+        while not finished:
+            event = await queue.get()
+            if event is _END:
+                break
+
+            parts = [event]
+            size = len(event)
+            deadline = loop.time() + max_delay
+            while size < max_bytes:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is _END:
+                    finished = True
+                    break
+                parts.append(event)
+                size += len(event)
+
+            yield parts[0][:0].join(parts)
+
+        if error is not None:
+            raise error
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup.
+
+app.config fails fast without these variables; the tests never reach OpenAI or
+Convex, so placeholders are enough to import the agents and graphs.
+"""
+
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("CONVEX_BASE_URL", "http://convex.test")
+# Keep checkpoints in memory
+os.environ.setdefault("CHECKPOINT_DB_PATH", "")
@@ -0,0 +1,37 @@
+"""
+Unit tests for the checkpoint CompressedSerializer.
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core.checkpointer import CompressedSerializer
+
+
+def test_small_payload_round_trips_uncompressed():
+    """Payloads under min_size are stored as the inner serializer wrote them."""
+    serde = CompressedSerializer(min_size=512)
+    value = {"requirements_question": "What is your budget?", "done": False}
+
+    typ, data = serde.dumps_typed(value)
+
+    assert not typ.endswith("+zlib")
+    assert (typ, data) == serde.serde.dumps_typed(value)
+    assert serde.loads_typed((typ, data)) == value
+
+
+def test_large_payload_round_trips_compressed():
+    """Payloads of at least min_size are zlib-compressed and restored intact."""
+    serde = CompressedSerializer(min_size=512)
+    value = {
+        "messages": [
+            HumanMessage(content="Plan a trip to Seoul " * 20, id="h1"),
+            AIMessage(content="Here is your itinerary " * 20, id="a1"),
+        ],
+        "itinerary": {"days": [{"date": f"2025-11-{day:02d}", "city": "Seoul"} for day in range(1, 20)]},
+    }
+
+    typ, data = serde.dumps_typed(value)
+
+    assert typ.endswith("+zlib")
+    assert len(data) < len(serde.serde.dumps_typed(value)[1])
+    assert serde.loads_typed((typ, data)) == value
@@ -4,9 +4,13 @@ Unit tests for the LangGraphToVercelAdapter.
 These tests demonstrate how to test the adapter without needing a real LLM.
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, Mock
-from langchain.messages import AIMessage, HumanMessage
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import StateGraph, MessagesState, START, END
 
 from app.utils.langgraph_vercel_adapter import LangGraphToVercelAdapter, stream_langgraph_to_vercel
@@ -100,10 +104,48 @@ def test_format_sse_event():
     data = {"type": "text-delta", "delta": "Hello"}
 
     result = adapter._format_sse_event(data)
-    assert result.startswith("data: ")
-    assert '"type":"text-delta"' in result
-    assert '"delta":"Hello"' in result
-    assert result.endswith("\n\n")
+    assert result.startswith(b"data: ")
+    assert b'"type":"text-delta"' in result
+    assert b'"delta":"Hello"' in result
+    assert result.endswith(b"\n\n")
+
+
+def test_text_delta_template_matches_format_sse_event():
+    """Templated text-delta frames are identical to the generic formatter's output."""
+    adapter = LangGraphToVercelAdapter(chunk_size=4)
+    content = 'Say "hi" ✈\n東京'
+
+    events = list(adapter._stream_text_chunked(content, "msg_1"))
+
+    expected = [
+        adapter._format_sse_event({"type": "text-delta", "id": "msg_1", "delta": content[i : i + 4]})
+        for i in range(0, len(content), 4)
+    ]
+    assert events == expected
+
+
+def test_tool_input_frames_match_format_sse_event():
+    """Templated tool-input frames match the generic formatter, including cached args."""
+    adapter = LangGraphToVercelAdapter()
+    message = AIMessage(content="", tool_calls=[
+        {"id": "call_1", "name": "search", "args": {"query": "Seoul", "limit": 1}},
+        {"id": "call_2", "name": "search", "args": {"query": "Seoul", "limit": True}},
+        {"id": "call_3", "name": "search", "args": {"query": "Seoul", "limit": 1}},
+        {"id": "call_4", "name": "search", "args": {"filters": {"stars": [3, 4]}}},
+    ])
+
+    events = list(adapter._stream_tool_calls(message))
+
+    expected = [
+        adapter._format_sse_event({
+            "type": "tool-input-available",
+            "toolCallId": call["id"],
+            "toolName": call["name"],
+            "input": call["args"],
+        })
+        for call in message.tool_calls
+    ]
+    assert events == expected
 
 
 def test_create_message_id():
@@ -128,7 +170,23 @@ async def test_adapter_stream_basic(simple_graph):
 
     # Should have at least a start event
     assert len(events) > 0
-    assert 'data: {"type":"start"' in events[0]
+    assert b'data: {"type":"start"' in events[0]
+
+
+def test_custom_data_fields_sent_once_per_value():
+    """Unchanged custom data fields are not re-sent on later state updates."""
+    adapter = LangGraphToVercelAdapter(custom_data_fields=["result"])
+    sent_data = {}
+    state = {"messages": [AIMessage(content="Hi")], "result": {"status": "success"}}
+
+    first = list(adapter._handle_node_update(state, sent_data))
+    second = list(adapter._handle_node_update(dict(state), sent_data))
+    state["result"] = {"status": "done"}
+    third = list(adapter._handle_node_update(state, sent_data))
+
+    assert sum(b'"type":"data-result"' in e for e in first) == 1
+    assert not any(b'"type":"data-result"' in e for e in second)
+    assert sum(b'"type":"data-result"' in e for e in third) == 1
 
 
 @pytest.mark.asyncio
@@ -166,6 +224,113 @@ async def test_adapter_with_custom_extractor(simple_graph):
     assert len(events) > 0
 
 
+def test_node_update_dispatches_by_message_type():
+    """Tool results stream as tool output, human messages are skipped, custom data always follows."""
+    adapter = LangGraphToVercelAdapter(custom_data_fields=["result"])
+
+    tool_events = list(adapter._handle_node_update({
+        "messages": [ToolMessage(content='{"ok": true}', tool_call_id="call_1")],
+        "result": {"status": "success"},
+    }))
+    assert tool_events[0] == b'data: {"type":"start-step"}\n\n'
+    assert b'"type":"tool-output-available","toolCallId":"call_1","output":{"ok":true}' in tool_events[1]
+    assert tool_events[2] == b'data: {"type":"finish-step"}\n\n'
+    assert b'"type":"data-result"' in tool_events[3]
+
+    human_events = list(adapter._handle_node_update({"messages": [HumanMessage(content="Hi")]}))
+    assert human_events == []
+
+
+def test_reemitted_message_streams_only_new_text():
+    """A message seen again under the same id streams only the appended text."""
+    adapter = LangGraphToVercelAdapter()
+    sent_text = {}
+
+    first = list(adapter._handle_node_update({"messages": [AIMessage(content="Hello", id="m1")]}, None, sent_text))
+    repeat = list(adapter._handle_node_update({"messages": [AIMessage(content="Hello", id="m1")]}, None, sent_text))
+    extended = list(adapter._handle_node_update({"messages": [AIMessage(content="Hello world", id="m1")]}, None, sent_text))
+
+    assert any(b'"delta":"Hello"' in e for e in first)
+    assert repeat == []
+    deltas = [e for e in extended if b'"type":"text-delta"' in e]
+    assert len(deltas) == 1 and b'"delta":" world"' in deltas[0]
+
+
+def test_reemitted_tool_result_without_id_is_sent_once():
+    """Tool results without a message id are deduped by their tool_call_id."""
+    adapter = LangGraphToVercelAdapter()
+    sent_text = {}
+    update = {"messages": [ToolMessage(content='{"ok": true}', tool_call_id="call_1")]}
+
+    first = list(adapter._handle_node_update(update, None, sent_text))
+    repeat = list(adapter._handle_node_update(update, None, sent_text))
+
+    assert any(b'"type":"tool-output-available"' in e for e in first)
+    assert repeat == []
+
+
+def test_large_tool_output_is_deferred():
+    """Oversized tool outputs are yielded as a callable instead of formatted inline."""
+    adapter = LangGraphToVercelAdapter()
+    content = '{"results": "' + "x" * (64 * 1024) + '"}'
+    events = list(adapter._handle_node_update({
+        "messages": [ToolMessage(content=content, tool_call_id="call_big")]
+    }))
+
+    deferred = [event for event in events if not isinstance(event, bytes)]
+    assert len(deferred) == 1
+    payload = json.loads(deferred[0]()[len(b"data: "):])
+    assert payload["toolCallId"] == "call_big"
+    assert payload["output"]["results"].startswith("xxx")
+
+
+@pytest.mark.asyncio
+async def test_llm_message_is_streamed_once_from_node_update():
+    """A model's reply is streamed once, from its node's update."""
+    model = GenericFakeChatModel(messages=iter([AIMessage(content="Hello there")]))
+
+    async def agent_node(state: MessagesState):
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    graph = StateGraph(MessagesState)
+    graph.add_node("agent", agent_node)
+    graph.add_edge(START, "agent")
+    graph.add_edge("agent", END)
+
+    adapter = LangGraphToVercelAdapter()
+    events = [
+        event
+        async for event in adapter.stream(graph.compile(), {"messages": [HumanMessage(content="Hi")]}, {})
+    ]
+
+    frames = [json.loads(line[len(b"data: "):]) for line in b"".join(events).split(b"\n\n") if line.startswith(b"data: {")]
+    deltas = [frame["delta"] for frame in frames if frame["type"] == "text-delta"]
+    assert deltas == ["Hello there"]
+    assert [frame["type"] for frame in frames].count("text-start") == 1
+    assert [frame["type"] for frame in frames].count("text-end") == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_with_final_state_resolves_after_stream():
+    """The final state is available once the event stream has been drained."""
+    graph = StateGraph(TestGraphState)
+    graph.add_node("agent", simple_agent_node)
+    graph.add_edge(START, "agent")
+    graph.add_edge("agent", END)
+    compiled = graph.compile(checkpointer=InMemorySaver())
+
+    adapter = LangGraphToVercelAdapter()
+    config = {"configurable": {"thread_id": "final-state"}}
+    events, final_state = await adapter.stream_with_final_state(
+        compiled, {"messages": [HumanMessage(content="Test")]}, config
+    )
+
+    assert not final_state.done()
+    assert [event async for event in events]
+    snapshot = await final_state
+    assert snapshot.values["result"] == {"status": "success"}
+
+
 # Edge case tests
 def test_extractor_handles_dict_messages():
     """Test extractor handles both BaseMessage and dict messages."""
@@ -0,0 +1,87 @@
+"""
+Unit tests for the coalesce() SSE batching wrapper.
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.stream_coalesce import coalesce
+
+
+async def _events(*items, delay: float = 0):
+    """Yield items, sleeping `delay` seconds between them."""
+    for index, item in enumerate(items):
+        if index and delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_reaches_max_bytes():
+    """Events arriving together are split once a batch reaches max_bytes."""
+    batches = [
+        batch
+        async for batch in coalesce(_events(b"aaaa", b"bbbb", b"cccc"), max_bytes=8, max_delay_ms=1000)
+    ]
+
+    assert batches == [b"aaaabbbb", b"cccc"]
+
+
+@pytest.mark.asyncio
+async def test_flushes_at_max_delay_deadline():
+    """An event arriving after the deadline starts a new batch."""
+    batches = [
+        batch
+        async for batch in coalesce(_events("a", "b", delay=0.05), max_bytes=8192, max_delay_ms=5)
+    ]
+
+    assert batches == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_events_within_deadline_share_a_batch():
+    """Events arriving before the deadline are joined."""
+    batches = [
+        batch
+        async for batch in coalesce(_events("a", "b", delay=0.01), max_bytes=8192, max_delay_ms=1000)
+    ]
+
+    assert batches == ["ab"]
+
+
+@pytest.mark.asyncio
+async def test_producer_error_is_reraised_after_buffered_events():
+    """Events read before a source error are still sent, then the error surfaces."""
+
+    async def failing():
+        yield b"data: 1\n\n"
+        raise ValueError("graph failed")
+
+    received = []
+    with pytest.raises(ValueError, match="graph failed"):
+        async for batch in coalesce(failing()):
+            received.append(batch)
+
+    assert received == [b"data: 1\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_closing_consumer_cancels_producer():
+    """Closing the stream early (client disconnect) stops the source."""
+    source_cancelled = asyncio.Event()
+
+    async def endless():
+        yield b"first"
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            source_cancelled.set()
+            raise
+        yield b"never"
+
+    stream = coalesce(endless(), max_delay_ms=1)
+    assert await anext(stream) == b"first"
+    await stream.aclose()
+
+    assert source_cancelled.is_set()
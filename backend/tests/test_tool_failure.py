@@ -0,0 +1,87 @@
+"""
+Unit tests for ToolFailureShortCircuitMiddleware.
+"""
+
+import pytest
+from langchain.agents import create_agent
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from app.agents.middleware.tool_failure import ToolFailureShortCircuitMiddleware
+from app.agents.tools.planner_tools import SEARCH_ERROR_PREFIX
+
+
+class CountingFakeChatModel(GenericFakeChatModel):
+    """Fake chat model that accepts tool binding and counts its calls."""
+
+    calls: int = 0
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, *args, **kwargs):
+        self.calls += 1
+        return super()._generate(*args, **kwargs)
+
+
+@tool("web_search")
+async def failing_web_search(query: str) -> str:
+    """Search the web."""
+    return f"{SEARCH_ERROR_PREFIX} rate limited"
+
+
+@pytest.mark.asyncio
+async def test_failed_tool_round_ends_agent_without_model_call():
+    """When every result of the latest tool round failed, the model isn't called again."""
+    model = CountingFakeChatModel(
+        messages=iter([
+            AIMessage(
+                content="",
+                tool_calls=[{"id": "call_1", "name": "web_search", "args": {"query": "Seoul"}}],
+            ),
+            AIMessage(content="should never be generated"),
+        ])
+    )
+    agent = create_agent(
+        model=model,
+        tools=[failing_web_search],
+        middleware=[ToolFailureShortCircuitMiddleware("Search is unavailable.")],
+    )
+
+    result = await agent.ainvoke({"messages": [HumanMessage(content="Plan a trip to Seoul")]})
+
+    assert model.calls == 1
+    assert result["messages"][-2].content.startswith(SEARCH_ERROR_PREFIX)
+    assert result["messages"][-1].content == "Search is unavailable."
+    assert "structured_response" not in result
+
+
+@pytest.mark.asyncio
+async def test_successful_tool_round_calls_model_again():
+    """A usable tool result lets the agent loop continue as usual."""
+
+    @tool("web_search")
+    async def working_web_search(query: str) -> str:
+        """Search the web."""
+        return "Gyeongbokgung Palace, Bukchon Hanok Village"
+
+    model = CountingFakeChatModel(
+        messages=iter([
+            AIMessage(
+                content="",
+                tool_calls=[{"id": "call_1", "name": "web_search", "args": {"query": "Seoul"}}],
+            ),
+            AIMessage(content="Here is your plan."),
+        ])
+    )
+    agent = create_agent(
+        model=model,
+        tools=[working_web_search],
+        middleware=[ToolFailureShortCircuitMiddleware("Search is unavailable.")],
+    )
+
+    result = await agent.ainvoke({"messages": [HumanMessage(content="Plan a trip to Seoul")]})
+
+    assert model.calls == 2
+    assert result["messages"][-1].content == "Here is your plan."
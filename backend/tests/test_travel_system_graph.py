@@ -0,0 +1,65 @@
+"""
+Unit tests for the travel system graph's requirements subgraph node.
+
+The real requirements subgraph calls the LLM, so it is replaced with a stub
+that asks its questions through interrupt() the same way.
+"""
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Command, interrupt
+
+from app.agents import travel_system_graph
+from app.agents.requirements_graph import RequirementsGraphState
+from app.agents.travel_system_graph import TravelSystemState, requirements_subgraph_node
+
+
+def _stub_requirements_graph():
+    """Requirements subgraph that asks two questions before completing."""
+
+    def gather(state: RequirementsGraphState):
+        name = interrupt("What is your name?")
+        budget = interrupt("What is your budget?")
+        return {
+            "requirements_complete": True,
+            "requirements": {"name": name, "budget": budget},
+        }
+
+    graph = StateGraph(RequirementsGraphState)
+    graph.add_node("gather", gather)
+    graph.add_edge(START, "gather")
+    graph.add_edge("gather", END)
+    return graph.compile(checkpointer=InMemorySaver())
+
+
+def _parent_graph():
+    """Only the requirements part of the travel graph: loop until complete."""
+    graph = StateGraph(TravelSystemState)
+    graph.add_node("requirements_subgraph", requirements_subgraph_node)
+    graph.add_edge(START, "requirements_subgraph")
+    graph.add_conditional_edges(
+        "requirements_subgraph",
+        lambda state: "requirements_subgraph" if state.get("requirements_question") else END,
+        ["requirements_subgraph", END],
+    )
+    return graph.compile(checkpointer=InMemorySaver())
+
+
+@pytest.mark.asyncio
+async def test_every_resume_answer_reaches_requirements(monkeypatch):
+    """Each question gets its own interrupt, and both answers end up in requirements."""
+    monkeypatch.setattr(travel_system_graph, "requirements_graph", _stub_requirements_graph())
+    graph = _parent_graph()
+    config = {"configurable": {"thread_id": "two-questions"}}
+
+    result = await graph.ainvoke({"messages": [("user", "Tokyo to Seoul")]}, config)
+    assert result["__interrupt__"][0].value == "What is your name?"
+
+    result = await graph.ainvoke(Command(resume="Alice"), config)
+    assert result["__interrupt__"][0].value == "What is your budget?"
+
+    result = await graph.ainvoke(Command(resume="2000 USD"), config)
+    assert "__interrupt__" not in result
+    assert result["requirements"] == {"name": "Alice", "budget": "2000 USD"}
+    assert result["requirements_question"] is None
@@ -0,0 +1,80 @@
+"""
+Unit tests for the trim_history helper behind TrimHistoryMiddleware.
+"""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from app.agents.middleware.trim_history import TrimHistoryMiddleware, trim_history
+
+
+def _tool_round(call_id: str) -> list:
+    """One AI tool call plus its result."""
+    return [
+        AIMessage(content="", tool_calls=[{"id": call_id, "name": "web_search", "args": {"query": call_id}}]),
+        ToolMessage(content=f"results for {call_id}", tool_call_id=call_id),
+    ]
+
+
+def test_short_history_is_returned_unchanged():
+    """Nothing to drop: the same list object comes back."""
+    messages = [HumanMessage(content="Plan my trip"), *_tool_round("a")]
+
+    assert trim_history(messages, keep_last=6) is messages
+
+
+def test_keeps_leading_human_message_and_recent_rounds():
+    """Everything up to the first user message survives, plus the tail."""
+    system = SystemMessage(content="You are a planner")
+    task = HumanMessage(content="Plan my trip")
+    messages = [system, task, *_tool_round("a"), *_tool_round("b"), *_tool_round("c")]
+
+    trimmed = trim_history(messages, keep_last=2)
+
+    assert trimmed[:2] == [system, task]
+    assert trimmed[2:] == messages[-2:]
+
+
+def test_cut_never_orphans_a_tool_result():
+    """A cut landing on a ToolMessage moves back to the AI message that called it."""
+    task = HumanMessage(content="Plan my trip")
+    messages = [task, *_tool_round("a"), *_tool_round("b"), *_tool_round("c")]
+
+    # The last message alone is a ToolMessage; its AIMessage must come along
+    trimmed = trim_history(messages, keep_last=1)
+
+    assert trimmed == [task, *messages[-2:]]
+    assert isinstance(trimmed[1], AIMessage)
+    assert trimmed[1].tool_calls[0]["id"] == trimmed[2].tool_call_id
+
+
+def test_parallel_tool_results_stay_with_their_call():
+    """Several results of one AI message are kept together with it."""
+    task = HumanMessage(content="Plan my trip")
+    call = AIMessage(
+        content="",
+        tool_calls=[
+            {"id": "x", "name": "web_search", "args": {"query": "x"}},
+            {"id": "y", "name": "web_search", "args": {"query": "y"}},
+        ],
+    )
+    results = [
+        ToolMessage(content="x results", tool_call_id="x"),
+        ToolMessage(content="y results", tool_call_id="y"),
+    ]
+    messages = [task, *_tool_round("a"), *_tool_round("b"), call, *results]
+
+    trimmed = trim_history(messages, keep_last=1)
+
+    assert trimmed == [task, call, *results]
+
+
+@pytest.mark.parametrize("keep_last", [0, -1])
+def test_keep_last_below_one_is_rejected(keep_last):
+    """keep_last must leave at least one message after the task prompt."""
+    messages = [HumanMessage(content="Plan my trip"), *_tool_round("a")]
+
+    with pytest.raises(ValueError):
+        trim_history(messages, keep_last=keep_last)
+    with pytest.raises(ValueError):
+        TrimHistoryMiddleware(keep_last=keep_last)